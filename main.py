@@ -124,7 +124,10 @@ async def main():
     
     # Connect and run forever
     logger.info("Starting connection to central API...")
-    await connection.run_forever()
+    try:
+        await connection.run_forever()
+    finally:
+        await update_manager.aclose()
 
 
 if __name__ == "__main__":
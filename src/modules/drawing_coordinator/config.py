@@ -32,3 +32,10 @@ MAX_TRANSMITTAL_SIZE = 1024 * 1024 * 1024 * 1.5  # 1.5 GB in bytes
 # Email attachment size limits (for future email scanning)
 MIN_ATTACHMENT_SIZE = 1024 * 10           # 10 KB - tiny files unlikely to be transmittals  
 MAX_ATTACHMENT_SIZE = 1024 * 1024 * 500   # 500 MB - email attachment practical limit
+
+# =============================================================================
+# Copy Concurrency
+# =============================================================================
+
+# Worker threads FolderBuilder uses to overlap file copies (effective I/O queue depth)
+COPY_WORKERS = min(32, (os.cpu_count() or 4) * 4)
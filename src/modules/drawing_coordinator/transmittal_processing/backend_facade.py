@@ -32,9 +32,7 @@ class BackendFacade:
         zip_path = Path(job_data["zip_path"])
         detector = TypeDetector(zip_path, utils=logger)
 
-        job_data["transmittal_type"] = detector.detect_type()
-        job_data["transmittal_number"] = detector.detect_transmittal_number()
-        job_data["job_number"] = detector.detect_job_number()
+        job_data.update(detector.detect_all())
 
         return job_data
 
@@ -1,11 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+import asyncio
 import shutil
 
 
+_IFA_CATS = frozenset({"erection"})
+_FULL_CATS = frozenset({"fab", "erection", "field", "parts", "void",
+                        "nc1", "dxf", "nc_dxf", "enc", "zeman"})
+
+
 class DistributionHandler:
     sd_drive = r'C:\Users\tylere.METALSFAB\Desktop\Shop Drawings\Jobs'
     nc_drive = r'C:\Users\tylere.METALSFAB\Desktop\NC Files'
 
+    max_concurrent_copies = 16
+
     def __init__(self, job_data: dict, utils = None):
         self.job_data = job_data
         self.utils = utils
@@ -26,6 +36,21 @@ class DistributionHandler:
 
 
     def distribute(self):
+        """
+        Synchronous entry point for distribute_async().
+
+        The agent runs the transmittal pipeline from inside its event loop, so when a
+        loop is already running the copy loop is driven on a private loop in a worker thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.distribute_async())
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, self.distribute_async()).result()
+
+    async def distribute_async(self):
         # Log what type of distribution is happening
         if self.utils:
             if self.transmittal_type == "IFA":
@@ -48,6 +73,13 @@ class DistributionHandler:
         seen_nc = set()
         seen_dxf = set()
 
+        # Cap in-flight copies so large jobs don't exhaust file handles on network shares
+        sem = asyncio.BoundedSemaphore(self.max_concurrent_copies)
+        copies = []
+        # Destination file -> source. nc1, dxf and nc_dxf all route to nc_dest and the
+        # combined folder repeats their filenames, so each path is copied once (last wins)
+        planned = {}
+
         for category, path in routing_table.items():
             # Skip categories not allowed for this transmittal type
             if category not in allowed_categories:
@@ -68,12 +100,7 @@ class DistributionHandler:
                     dest_folder = path / folder.name
                     if self.utils:
                         self.utils.append_log_action(f"Copying Zeman folder {folder.name} to {path}", "Success")
-                    try:
-                        shutil.copytree(folder, dest_folder, dirs_exist_ok=True)
-                        distribution_map.setdefault(category, []).append(folder)
-                    except Exception as e:
-                        if self.utils:
-                            self.utils.append_log_action(f"Error copying Zeman folder {folder}: {e}", "Error")
+                    copies.append(self._copy_zeman_folder(sem, category, folder, dest_folder, distribution_map))
                 continue
 
             files = discovered_files.get(category, [])
@@ -81,19 +108,25 @@ class DistributionHandler:
                 continue
 
             path.mkdir(parents=True, exist_ok=True)
+
+            # Decide once per category which stem sets it can feed
+            track_nc = category in ("nc1", "nc_dxf")
+            track_dxf = category in ("dxf", "nc_dxf")
+
             for file in files:
                 distribution_map.setdefault(category, []).append(file)
 
-                if category in ("nc1", "nc_dxf") and file.suffix.lower() == ".nc1":
-                    seen_nc.add(file.stem)
-                if category in ("dxf", "nc_dxf") and file.suffix.lower() == ".dxf":
-                    seen_dxf.add(file.stem)
+                if track_nc or track_dxf:
+                    suffix = file.suffix.lower()
+                    if track_nc and suffix == ".nc1":
+                        seen_nc.add(file.stem)
+                    if track_dxf and suffix == ".dxf":
+                        seen_dxf.add(file.stem)
 
-                try:
-                    shutil.copy2(file, path)
-                except Exception as e:
-                    if self.utils:
-                        self.utils.append_log_action(f"Error copying {file}: {e}", "Error")
+                planned[path / file.name] = file
+
+        copies.extend(self._copy_file(sem, file, dest) for dest, file in planned.items())
+        await asyncio.gather(*copies)
 
         count_data = {}
         for category, files in distribution_map.items():
@@ -109,6 +142,27 @@ class DistributionHandler:
         return {"count_data": count_data,
                 "distribution_map": distribution_map}
 
+    async def _copy_file(self, sem: asyncio.BoundedSemaphore, file: Path, dest: Path):
+        loop = asyncio.get_running_loop()
+        async with sem:
+            try:
+                await loop.run_in_executor(None, shutil.copy2, file, dest)
+            except Exception as e:
+                if self.utils:
+                    self.utils.append_log_action(f"Error copying {file}: {e}", "Error")
+
+    async def _copy_zeman_folder(self, sem: asyncio.BoundedSemaphore, category: str, folder: Path, dest_folder: Path, distribution_map: dict):
+        loop = asyncio.get_running_loop()
+        async with sem:
+            try:
+                await loop.run_in_executor(
+                    None, partial(shutil.copytree, folder, dest_folder, dirs_exist_ok=True)
+                )
+                distribution_map.setdefault(category, []).append(folder)
+            except Exception as e:
+                if self.utils:
+                    self.utils.append_log_action(f"Error copying Zeman folder {folder}: {e}", "Error")
+
     def _discover_structure(self) -> dict:
         mapping = {
             "fab":          self.built_root / "Drawings/Fabrication Drawings",
@@ -128,18 +182,17 @@ class DistributionHandler:
 
         return {k: v for k, v in mapping.items() if v.exists()}
 
-    def _get_allowed_categories(self) -> list:
+    def _get_allowed_categories(self) -> frozenset:
         """
-        Returns list of categories that should be distributed based on transmittal type.
+        Returns the set of categories that should be distributed based on transmittal type.
         
         - IFF: All categories (full distribution)
         - IFA: Only erection drawings
         """
         if self.transmittal_type == "IFA":
-            return ["erection"]
+            return _IFA_CATS
         else:  # IFF or any other type defaults to full distribution
-            return ["fab", "erection", "field", "parts", "void", 
-                    "nc1", "dxf", "nc_dxf", "enc", "zeman"]
+            return _FULL_CATS
 
 
     def _discover_files(self):
@@ -1,7 +1,10 @@
+import os
 import re
 from pathlib import Path
 from src.modules.drawing_coordinator.logger import HeadlessLogger
 
+IGNORED_FOLDER_NAMES = frozenset({"drawings", "pdf assemblies", "ifc package"})
+
 class FileClassifier:
 
     def __init__(self, temp_dir: Path, transmittal_type: str, transmittal_number, utils = None):
@@ -28,6 +31,9 @@ class FileClassifier:
             "original":     []
         }
 
+        # PDFs seen under "PDF Assemblies" folders during the file-level scan,
+        # held back as the fab fallback so it needs no extra tree walk.
+        self._pdf_assemblies_pdfs = []
 
         self.patterns = {
             "zeman":            re.compile(r"(?:\d+\.\s*)?\bzeman([\s_\-]?(files?|reports?|exports?))?\b", re.IGNORECASE),
@@ -52,70 +58,38 @@ class FileClassifier:
         self._collect_original_files()
 
         # --- OTHER CATEGORIES ---
-        for folder in self.temp_dir.rglob("*"):
-            if not folder.is_dir():
+        temp_root = str(self.temp_dir)
+        for _entry, name, path, is_dir in self._scandir_recursive(temp_root):
+            if not is_dir:
                 continue
 
-            if self._is_ignored_folder(folder):
+            if self._is_ignored_folder(path):
                 continue
 
-            if self._is_root_transmittal_folder(folder):
+            if os.path.dirname(path) == temp_root and self._is_root_transmittal_folder(Path(path)):
                 if self.utils:
-                    self.utils.append_log_action(f"Skipping root transmittal folder: {folder}", "Info")
+                    self.utils.append_log_action(f"Skipping root transmittal folder: {path}", "Info")
                 continue
 
             if self.utils:
-                self.utils.append_log_action(f"Classifying {folder}", "Info")
-
-            # skip already-detected Zeman folders
-            if any(folder.is_relative_to(z) or z.is_relative_to(folder) for z in self.categories["zeman"]):
-                continue
-
-            if self.patterns["fab_dwgs"].search(folder.name):
-                for pdf in folder.rglob("*.pdf"):
-                    if self._is_ignored_fab_dwg(pdf):
-                        continue
-                    if pdf not in self.categories["fab"]:
-                        self.categories["fab"].append(pdf)
-                continue
-
-            if self.patterns["fab_folder"].search(folder.name):
-                for pdf in folder.rglob("*.pdf"):
-                    if self._is_ignored_fab_dwg(pdf):
-                        continue
-                    if pdf not in self.categories["fab"]:
-                        self.categories["fab"].append(pdf)
-                continue
-
-            if self.patterns["parts"].search(folder.name):
-                for pdf in folder.rglob("*.pdf"):
-                    if pdf not in self.categories["parts"]:
-                        self.categories["parts"].append(pdf)
-                continue
+                self.utils.append_log_action(f"Classifying {path}", "Info")
 
-            if self.patterns["erection"].search(folder.name):
-                for pdf in folder.rglob("*.pdf"):
-                    if pdf not in self.categories["erection"]:
-                        self.categories["erection"].append(pdf)
+            # Regexes run on the plain name; only matching folders get a Path
+            category = self._match_folder_category(name)
+            if category is None:
                 continue
 
-            if self.patterns["erection_OL"].search(folder.name):
-                for pdf in folder.rglob("*.pdf"):
-                    if pdf not in self.categories["erection"]:
-                        self.categories["erection"].append(pdf)
-                continue
+            folder = Path(path)
 
-            if self.patterns["field"].search(folder.name):
-                for pdf in folder.rglob("*.pdf"):
-                    if pdf not in self.categories["field"]:
-                        self.categories["field"].append(pdf)
+            # skip already-detected Zeman folders
+            if any(folder.is_relative_to(z) or z.is_relative_to(folder) for z in self.categories["zeman"]):
                 continue
 
-            if self.patterns["void"].search(folder.name):
-                for pdf in folder.rglob("*.pdf"):
-                    if pdf not in self.categories["void"]:
-                        self.categories["void"].append(pdf)
-                continue
+            for pdf in folder.rglob("*.pdf"):
+                if category == "fab" and self._is_ignored_fab_dwg(pdf):
+                    continue
+                if pdf not in self.categories[category]:
+                    self.categories[category].append(pdf)
 
         if self.utils:
             self.utils.append_log_action("Classified all folders", "Info")
@@ -131,6 +105,9 @@ class FileClassifier:
                 continue
 
             ext = file.suffix.lower()
+            if ext == ".pdf" and self._is_under_pdf_assemblies(file):
+                self._pdf_assemblies_pdfs.append(file)
+
             if ext in [".xml", ".kss"]:
                 self.categories["import"].append(file)
                 continue
@@ -216,22 +193,8 @@ class FileClassifier:
                     "Info"
                 )
 
-            pdf_assemblies_dirs = [
-                folder for folder in self.temp_dir.rglob("*")
-                if folder.is_dir() and folder.name.lower() == "pdf assemblies"
-            ]
-
-            for folder in pdf_assemblies_dirs:
-                # Skip any PDF Assemblies folder that lives under a Zeman path
-                if any(folder.is_relative_to(z) for z in zeman_paths):
-                    continue
-
-                for pdf in folder.rglob("*.pdf"):
-                    # Also skip PDFs inside Zeman subtrees, just in case
-                    if any(pdf.is_relative_to(z) for z in zeman_paths):
-                        continue
-                    if pdf not in self.categories["fab"]:
-                        self.categories["fab"].append(pdf)
+            # Candidates were gathered (Zeman subtrees excluded) during the file-level scan
+            self.categories["fab"].extend(self._pdf_assemblies_pdfs)
 
             if self.utils:
                 self.utils.append_log_action(
@@ -285,6 +248,42 @@ class FileClassifier:
                     if numeric_or_alpha.match(name) or zeman_style.match(name):
                         self.categories["zeman"].append(sub)
 
+    def _scandir_recursive(self, path: str):
+        """
+        Walk the tree with os.scandir, yielding (entry, name, path, is_dir).
+        Same visiting order as Path.rglob("*"): a directory's entries first,
+        then each subdirectory in turn. Symlinked directories are not followed.
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except PermissionError:
+            return
+
+        subdirs = []
+        for entry in entries:
+            is_dir = entry.is_dir()
+            yield entry, entry.name, entry.path, is_dir
+            if is_dir and not entry.is_symlink():
+                subdirs.append(entry.path)
+
+        for sub in subdirs:
+            yield from self._scandir_recursive(sub)
+
+    def _match_folder_category(self, name: str):
+        """Return the drawing category a folder name maps to, or None."""
+        if self.patterns["fab_dwgs"].search(name) or self.patterns["fab_folder"].search(name):
+            return "fab"
+        if self.patterns["parts"].search(name):
+            return "parts"
+        if self.patterns["erection"].search(name) or self.patterns["erection_OL"].search(name):
+            return "erection"
+        if self.patterns["field"].search(name):
+            return "field"
+        if self.patterns["void"].search(name):
+            return "void"
+        return None
+
     def _collect_original_files(self):
 
         for f in self.temp_dir.iterdir():
@@ -295,11 +294,15 @@ class FileClassifier:
         path_str = str(path).lower()
         return any(tok in path_str for tok in ("pdf assemblies", "pdf parts", "ifc package"))
 
-    def _is_ignored_folder(self, path: Path) -> bool:
-        for part in path.parts:
-            if part.lower() in {"drawings", "pdf assemblies", "ifc package"}:
-                return True
-        return False
+    def _is_under_pdf_assemblies(self, path: Path) -> bool:
+        """True if any folder between temp_dir and the file is named 'PDF Assemblies'."""
+        parents = path.relative_to(self.temp_dir).parts[:-1]
+        return any(part.lower() == "pdf assemblies" for part in parents)
+
+    def _is_ignored_folder(self, path: Path | str) -> bool:
+        # Accepts plain strings so the scandir walk doesn't need a Path per folder
+        parts = os.fspath(path).lower().replace("\\", "/").split("/")
+        return not IGNORED_FOLDER_NAMES.isdisjoint(parts)
 
     def _is_root_transmittal_folder(self, folder: Path) -> bool:
         """
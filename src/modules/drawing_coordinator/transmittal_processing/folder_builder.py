@@ -1,18 +1,125 @@
+import os
 import shutil
+import sys
+import threading
 import zipfile
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import re
 
 from datetime import datetime
+from stat import S_ISDIR, S_ISREG
 
+from src.modules.drawing_coordinator.config import COPY_WORKERS
 from src.modules.drawing_coordinator.logger import HeadlessLogger
 
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _CopyFileExW = _kernel32.CopyFileExW
+    _CopyFileExW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p,
+                             ctypes.c_void_p, ctypes.POINTER(wintypes.BOOL), wintypes.DWORD]
+    _CopyFileExW.restype = wintypes.BOOL
+else:
+    _CopyFileExW = None
+
+
+# Revision / bucket patterns used once per drawing filename - compiled at import
+_PART_LIKE_RE = re.compile(
+    r"^(?P<prefix>.+?)\s*-\s*(?P<desc>[^-]+?)\s*-\s*(?P<rev>rev(?:ision)?[\s_\-]?[a-z0-9]+)\s*$",
+    re.IGNORECASE,
+)
+_REV_SUB_RE = re.compile(r"([_\-\s]?rev[\s_\-]?[a-z0-9]+|_[a-z0-9]$)", re.IGNORECASE)
+_BUCKET_RE = re.compile(
+    r"(?:\b(?:rev(?:ision)?\s*[-_.:]*\s*|r(?:\s*[-_.:]+\s*|\s+|(?=[0-9])))([A-Z0-9]+)|[-_]([A-Z0-9]{1,2})(?=\.[^.]+$|$))",
+    re.IGNORECASE,
+)
+_JUNK_RE = re.compile(r"[\s\(\[]")
+
+# Per-thread 1 MiB buffer for readinto copies (shutil's non-Windows default is 64 KiB)
+_COPY_BUFSIZE = 1 << 20
+_copy_buffers = threading.local()
+
+# One cached stat per classified source path (see FolderBuilder._validate_paths)
+_FileRec = namedtuple("_FileRec", ["path", "stat", "is_dir"])
+
+
+def _fastcopy(src, dest):
+    """
+    Copy file contents without copy2's separate stat/copystat round-trips.
+
+    Windows: CopyFileExW - one call, server-side on SMB shares, keeps timestamps.
+    Elsewhere: shutil.copyfile, which already uses sendfile/fcopyfile with a
+    copyfileobj fallback, then copystat for the mode and timestamps copy2 kept.
+    """
+    if _CopyFileExW is not None:
+        if not _CopyFileExW(os.fspath(src), os.fspath(dest), None, None, None, 0):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return
+    shutil.copyfile(src, dest)
+    shutil.copystat(src, dest)
+
+
+def _copy_buffered(src, dest):
+    """Plain readinto/write loop through this thread's reusable 1 MiB buffer."""
+    view = getattr(_copy_buffers, "view", None)
+    if view is None:
+        view = _copy_buffers.view = memoryview(bytearray(_COPY_BUFSIZE))
+
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+        while n := fsrc.readinto(view):
+            fdst.write(view[:n])
+
+
+def _copy_local(src, dest):
+    """
+    Duplicate a file that was just written to the output tree.
+
+    Linux: copy_file_range - reflinks on btrfs/XFS, otherwise an in-kernel copy
+    served from the page cache. If the kernel refuses, a buffered copy.
+    Either way followed by copystat, as _fastcopy does. Anywhere else: _fastcopy.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not sent:
+                        break
+                    remaining -= sent
+        except OSError:
+            _copy_buffered(src, dest)
+        shutil.copystat(src, dest)
+        return
+    _fastcopy(src, dest)
+
+
+def _extract_members(zip_path, names, dest_dir):
+    """
+    Extract the named members using this worker's own ZipFile handle.
+    ZipFile.extract keeps extractall's path sanitising.
+    """
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        for name in names:
+            try:
+                zip_ref.extract(name, dest_dir)
+            except FileExistsError:
+                # Another batch created the same parent folder between exists() and makedirs()
+                zip_ref.extract(name, dest_dir)
+
+
 class FolderBuilder:
 
     def __init__(self, output_dir: Path, classified_files: dict, transmittal_type, transmittal_number, job_number=None, utils = None):
         self.output_dir = output_dir.resolve()
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        self._records = {}
         self.classified_files = self._validate_paths(classified_files)
         self.transmittal_type = transmittal_type
         self.transmittal_number = transmittal_number
@@ -21,6 +128,12 @@ class FolderBuilder:
 
         self.current_date = datetime.now().strftime("%y%m%d")
 
+        # Copies are I/O bound (often to network shares) - overlap them on a thread pool
+        self._pool = ThreadPoolExecutor(max_workers=COPY_WORKERS)
+
+        # Copy workers queue their log lines here; the building thread hands them to utils
+        self._log_queue = deque()
+
         # Determine job bucket
         job_bucket = self.job_number if self.job_number else "Unknown Job Number"
 
@@ -62,16 +175,21 @@ class FolderBuilder:
         }
 
     def build_folder_structure(self) -> dict:
-        self._copy_originals()
-        self._copy_to_revisions()
-        self._copy_drawings()
-        self._copy_data_files()
-        self._check_stray_nc_files()
-        self._copy_import_files()
-        self._copy_zeman_folders()
-        self._copy_model_files()
-        self._copy_other_folders()
-        self._finalize()
+        try:
+            self._prebuild_directories()
+            self._copy_originals()
+            self._copy_to_revisions()
+            self._copy_drawings()
+            self._copy_data_files()
+            self._check_stray_nc_files()
+            self._copy_import_files()
+            self._copy_zeman_folders()
+            self._copy_model_files()
+            self._copy_other_folders()
+            self._finalize()
+        finally:
+            # A step that raises must not leave the copy threads behind
+            self._pool.shutdown(wait=True)
 
         return {
             "built_output": self.base,
@@ -84,35 +202,111 @@ class FolderBuilder:
 
 # ---------------------------------------------------------------------
 
+    def _prebuild_directories(self):
+        """
+        Create every folder this build will copy into in one pass, so the _copy_*
+        methods never mkdir per file. Only folders that will receive files are
+        created - categories with nothing in them still don't show up in the output.
+        """
+        files = self.classified_files
+        structure = self.structure
+        dirs = [structure["revisions"]]
+
+        for category in self._get_drawing_categories():
+            category_files = files.get(category, [])
+            if not category_files:
+                continue
+
+            dirs.append(structure["revisions"] / self.revision_map[category])
+
+            pdf_names = [f.name for f in category_files if f.name.lower().endswith(".pdf")]
+            if category == "erection":
+                dirs.extend(structure[category] / self._detect_bucket(name, "E") for name in pdf_names)
+            elif category == "field":
+                dirs.extend(structure[category] / self._detect_bucket(name, "F") for name in pdf_names)
+            elif pdf_names:
+                dirs.append(structure[category])
+
+        if files.get("nc1"):
+            dirs += [structure["nc1"], structure["nc_dxf"]]
+        if files.get("dxf"):
+            dirs += [structure["dxf"], structure["nc_dxf"]]
+
+        for category in ("original", "enc", "nc_issue", "import", "zeman", "model"):
+            if files.get(category):
+                dirs.append(structure[category])
+
+        other_files = files.get("other")
+        if other_files:
+            dirs.append(structure["other"])
+            if any(f.name.lower().endswith(".xsr") for f in other_files):
+                dirs.append(structure["other"] / "XSR Files")
+            if files.get("zips"):
+                dirs.append(structure["zips"])
+
+        for folder in dict.fromkeys(map(os.fspath, dirs)):
+            try:
+                os.makedirs(folder, exist_ok=True)
+            except OSError as e:
+                if self.utils:
+                    self.utils.append_log_action(f"Error creating folder {folder}: {e}", "Error")
+
+
     def _copy_originals(self):
         original_files = self.classified_files.get("original", [])
         if not original_files:
             return
 
         original_dir = self.structure["original"]
-        original_dir.mkdir(parents=True, exist_ok=True)
 
+        # Extraction reads the source zip, not our copy of it, so it runs alongside the
+        # copies. Only a zip whose top-level entries land in an original folder being
+        # copied waits for that copy, so both never write the same files at once.
+        dir_names = {src.name for src in original_files if self._is_dir(src)}
+
+        copies = []
+        dir_copies = []
+        deferred = []
+        extractions = []
         for src in original_files:
-            if src.is_dir():
+            if self._is_dir(src):
                 dest_dir = original_dir / src.name
-                self._safe_copy_dir(src, dest_dir)
+                dir_copies.extend(self._safe_copy_dir(src, dest_dir))
                 continue
 
-            if src.is_file() and src.suffix.lower() == ".zip":
-                self._safe_copy(src, original_dir / src.name)
-
+            if self._is_file(src) and src.name.lower().endswith(".zip"):
+                copies.append(self._submit_copy(src, original_dir / src.name))
                 try:
                     with zipfile.ZipFile(src, "r") as zip_ref:
-                        zip_ref.extractall(original_dir)
-                    if self.utils:
-                        self.utils.append_log_action(f"Extracted nested zip: {src}", "Success")
+                        names = zip_ref.namelist()
                 except Exception as e:
                     if self.utils:
                         self.utils.append_log_action(f"Error extracting nested zip: {src}: {e}", "Error")
+                    continue
+
+                if dir_names.intersection(name.split("/", 1)[0] for name in names):
+                    deferred.append((src, names))
+                else:
+                    extractions.append((src, self._submit_extract(src, names, original_dir)))
                 continue
 
-            if src.is_file():
-                self._safe_copy(src, original_dir / src.name)
+            if self._is_file(src):
+                copies.append(self._submit_copy(src, original_dir / src.name))
+
+        self._wait_copies(dir_copies)
+        for src, names in deferred:
+            extractions.append((src, self._submit_extract(src, names, original_dir)))
+
+        self._wait_copies(copies)
+
+        for src, futures in extractions:
+            errors = [f.exception() for f in futures if f.exception()]
+            if not self.utils:
+                continue
+            if errors:
+                self.utils.append_log_action(f"Error extracting nested zip: {src}: {errors[0]}", "Error")
+            else:
+                self.utils.append_log_action(f"Extracted nested zip: {src}", "Success")
 
         if self.utils:
             self.utils.append_log_action("Copied all original files", "Success")
@@ -125,8 +319,10 @@ class FolderBuilder:
         revision_map = self.revision_map
 
         revision_dir = self.structure["revisions"]
-        revision_dir.mkdir(parents=True, exist_ok=True)
 
+        # dest -> src in classifier order, so the last revision of a name wins
+        # deterministically and each destination gets exactly one copy
+        planned = {}
         for category in drawing_categories:
             files = self.classified_files.get(category, [])
             copy_map[category] = []
@@ -135,20 +331,23 @@ class FolderBuilder:
                 continue
 
             target_dir = revision_dir / revision_map[category]
-            target_dir.mkdir(parents=True, exist_ok=True)
+            target_dir_str = os.fspath(target_dir)
 
             for src in files:
-                if src.suffix.lower() != ".pdf":
+                name = src.name
+                if not name.lower().endswith(".pdf"):
                     continue
 
-                dest = target_dir / src.name
-                self._safe_copy(src, dest)
+                dest = os.path.join(target_dir_str, name)
+                self._plan_copy(planned, src, dest)
                 copy_map[category].append(dest)
                 # print(f'Source: {src} | Destination: {dest}\n')
 
             if self.utils:
                 self.utils.append_log_action(f"Copied {len(files)} {category} drawings to {target_dir}", "Success")
 
+        self._wait_copies(self._submit_planned(planned))
+
         if self.utils:
             self.utils.append_log_action("Copied all revisions", "Success")
             self.utils.set_status_bar("Revisions Backup - Complete")
@@ -157,6 +356,9 @@ class FolderBuilder:
 
 
     def _copy_drawings(self):
+        # dest -> src in classifier order (see _plan_renamed_copy)
+        planned = {}
+
         for category in self._get_drawing_categories():
             files = self.classified_files.get(category, [])
             if not files:
@@ -165,26 +367,26 @@ class FolderBuilder:
                     self.utils.append_log_action(f"No files to copy for {category}", "info")
                 continue
 
+            category_dir = os.fspath(self.structure[category])
+            target_dir = category_dir
             for src in files:
-                if src.suffix.lower() != ".pdf":
+                name = src.name
+                if not name.lower().endswith(".pdf"):
                     continue
 
-                target_dir = self.structure[category]
-                target_dir.mkdir(parents=True, exist_ok=True)
+                target_dir = category_dir
 
                 if category == "erection":
-                    bucket = self._detect_bucket(src.name, "E") # -> "E1", "E2", etc.
+                    bucket = self._detect_bucket(name, "E") # -> "E1", "E2", etc.
                     if bucket:
-                        target_dir = target_dir / bucket
-                        target_dir.mkdir(parents=True, exist_ok=True)
+                        target_dir = os.path.join(category_dir, bucket)
 
                 if category == "field":
-                    bucket = self._detect_bucket(src.name, "F") # -> "F1", "F2", etc.
+                    bucket = self._detect_bucket(name, "F") # -> "F1", "F2", etc.
                     if bucket:
-                        target_dir = target_dir / bucket
-                        target_dir.mkdir(parents=True, exist_ok=True)
+                        target_dir = os.path.join(category_dir, bucket)
 
-                dest = self._rename_and_copy(src, target_dir)
+                self._plan_renamed_copy(src, target_dir, planned)
 
             if self.utils:
                 self.utils.append_log_action(
@@ -192,6 +394,8 @@ class FolderBuilder:
                     "Success"
                 )
 
+        self._wait_copies([self._pool.submit(self._safe_copy_replace, src, dest) for dest, src in planned.items()])
+
 
     def _copy_data_files(self):
         """
@@ -207,45 +411,42 @@ class FolderBuilder:
                     self.utils.append_log_action("No Data files to copy", "Info")
                 return
 
-            if nc_files:
-                # Make sure dir exists
-                nc_dir = self.structure["nc1"]
-                nc_dir.mkdir(parents=True, exist_ok=True)
-
-                nc_dxf_combined_dir = self.structure["nc_dxf"]
-                nc_dxf_combined_dir.mkdir(parents=True, exist_ok=True)
-
-                # Copy NC1 files
-                for src in nc_files:
-                    dest = nc_dir / src.name
-                    self._safe_copy(src, dest)
-                    combine_dest = nc_dxf_combined_dir / src.name
-                    self._safe_copy(src, combine_dest)
-
-
-            if dxf_files:
-                # Make sure dir exists
-                dxf_dir = self.structure["dxf"]
-                dxf_dir.mkdir(parents=True, exist_ok=True)
-                nc_dxf_combined_dir = self.structure["nc_dxf"]
-                nc_dxf_combined_dir.mkdir(parents=True, exist_ok=True)
-
-                # Copy DXF files
-                for src in dxf_files:
-                    dest = dxf_dir / src.name
-                    self._safe_copy(src, dest)
-                    combine_dest = nc_dxf_combined_dir / src.name
-                    self._safe_copy(src, combine_dest)
+            # dest -> src (last wins). The NC-DXF Combined folder is planned
+            # across NC1 and DXF together; pair_of maps each NC1/DXF dest to
+            # the Combined dest it would also feed
+            planned = {}
+            combined = {}
+            pair_of = {}
+
+            combined_dir_str = os.fspath(self.structure["nc_dxf"])
+            for files, category in ((nc_files, "nc1"), (dxf_files, "dxf")):
+                dir_str = os.fspath(self.structure[category])
+                for src in files:
+                    name = src.name
+                    dest = os.path.join(dir_str, name)
+                    combine_dest = os.path.join(combined_dir_str, name)
+                    self._plan_copy(planned, src, dest)
+                    combined[combine_dest] = src
+                    pair_of[dest] = combine_dest
 
             if enc_files:
-                # Make sure dir exists
-                enc_dir = self.structure["enc"]
-                enc_dir.mkdir(parents=True, exist_ok=True)
-
-                # Copy ENC files
+                enc_dir_str = os.fspath(self.structure["enc"])
                 for src in enc_files:
-                    dest = enc_dir / src.name
-                    self._safe_copy(src, dest)
+                    self._plan_copy(planned, src, os.path.join(enc_dir_str, src.name))
+
+            # Where the same source wins both folders, copy it once and make
+            # the Combined copy from the local result (see _safe_copy_pair)
+            copies = []
+            for dest, src in planned.items():
+                combine_dest = pair_of.get(dest)
+                if combine_dest and combined.get(combine_dest) is src:
+                    del combined[combine_dest]
+                    copies.append(self._pool.submit(self._safe_copy_pair, src, dest, combine_dest))
+                else:
+                    copies.append(self._submit_copy(src, dest))
+            copies += self._submit_planned(combined)
+
+            self._wait_copies(copies)
 
             if self.utils:
                 nc_count = len(nc_files)
@@ -290,11 +491,12 @@ class FolderBuilder:
             return
 
         import_dir = self.structure["import"]
-        import_dir.mkdir(parents=True, exist_ok=True)
 
+        import_dir_str = os.fspath(import_dir)
+        planned = {}
         for src in import_files:
-            dest = import_dir / src.name
-            self._safe_copy(src, dest)
+            self._plan_copy(planned, src, os.path.join(import_dir_str, src.name))
+        self._wait_copies(self._submit_planned(planned))
 
         if self.utils:
             self.utils.append_log_action("Copied all import files", "Success")
@@ -311,16 +513,21 @@ class FolderBuilder:
             return
 
         zeman_base_folder = self.structure["zeman"]
-        zeman_base_folder.mkdir(parents=True, exist_ok=True)
 
-        copied_count = 0
+        # dest -> folder, last wins - so no folder is removed while an earlier
+        # same-named one is still being copied into it
+        planned = {}
         for folder in zeman_folders:
-            dest = zeman_base_folder / folder.name
+            self._plan_copy(planned, folder, zeman_base_folder / folder.name)
+
+        copies = []
+        copied_count = 0
+        for dest, folder in planned.items():
             try:
                 if dest.exists():
                     shutil.rmtree(dest)
 
-                self._safe_copy_dir(folder, dest)
+                copies.extend(self._safe_copy_dir(folder, dest))
                 copied_count += 1
             except Exception as e:
                 print(e)
@@ -328,6 +535,8 @@ class FolderBuilder:
                     self.utils.append_log_action(f"Error copying Zeman folder {folder}: {e}", "Error")
                     self.utils.set_status_bar("Error: Failed to copy Zeman folder")
 
+        self._wait_copies(copies)
+
         if self.utils:
             self.utils.append_log_action(f"Copied {copied_count} Zeman folders", "Success")
             self.utils.set_status_bar(f"Copied {copied_count} Zeman folders")
@@ -339,11 +548,12 @@ class FolderBuilder:
             return
 
         model_dir = self.structure["model"]
-        model_dir.mkdir(parents=True, exist_ok=True)
 
+        model_dir_str = os.fspath(model_dir)
+        planned = {}
         for src in model_files:
-            dest = model_dir / src.name
-            self._safe_copy(src, dest)
+            self._plan_copy(planned, src, os.path.join(model_dir_str, src.name))
+        self._wait_copies(self._submit_planned(planned))
 
         if self.utils:
             self.utils.append_log_action(f"Copied {len(model_files)} model files", "Success")
@@ -359,20 +569,18 @@ class FolderBuilder:
             return
 
         other_dir = self.structure["other"]
-        other_dir.mkdir(parents=True, exist_ok=True)
 
 
+        planned = {}
+        xsr_dir = self.structure["other"] / "XSR Files"
         for src in other_files:
             if src.name.lower().endswith(".xsr"):
-                xsr_dir = self.structure["other"] / "XSR Files"
-                xsr_dir.mkdir(parents=True, exist_ok=True)
-                dest = xsr_dir / src.name
-                self._safe_copy(src, dest)
+                self._plan_copy(planned, src, os.path.join(xsr_dir, src.name))
                 continue
 
-            dest = other_dir / src.name
-            self._safe_copy(src, dest)
+            self._plan_copy(planned, src, os.path.join(other_dir, src.name))
 
+        self._wait_copies(self._submit_planned(planned))
         self._copy_zip_folders()
 
         if self.utils:
@@ -384,11 +592,12 @@ class FolderBuilder:
         if not zip_files:
             return
         zip_dir = self.structure["zips"]
-        zip_dir.mkdir(parents=True, exist_ok=True)
 
+        zip_dir_str = os.fspath(zip_dir)
+        planned = {}
         for src in zip_files:
-            dest = zip_dir / src.name
-            self._safe_copy(src, dest)
+            self._plan_copy(planned, src, os.path.join(zip_dir_str, src.name))
+        self._wait_copies(self._submit_planned(planned))
 
         if self.utils:
             self.utils.append_log_action(f"Copied {len(zip_files)} zip files to /Lists & Misc", "Success")
@@ -399,17 +608,21 @@ class FolderBuilder:
             return
 
         nc_issue_dir = self.structure["nc_issue"]
-        nc_issue_dir.mkdir(parents=True, exist_ok=True)
 
+        nc_issue_dir_str = os.fspath(nc_issue_dir)
+        planned = {}
         for src in nc_issue_files:
-            dest = nc_issue_dir / src.name
-            self._safe_copy(src, dest)
+            self._plan_copy(planned, src, os.path.join(nc_issue_dir_str, src.name))
+        self._wait_copies(self._submit_planned(planned))
 
         if self.utils:
             self.utils.append_log_action(f"Copied {len(nc_issue_files)} NC Error files to /CNC Data - NC files found outside of zeman folders", "Success")
             self.utils.set_status_bar("NC Error files copied successfully - Please see log for details")
 
     def _finalize(self):
+        self._pool.shutdown(wait=True)
+        self._flush_log()
+
         if self.utils:
             self.utils.append_log_action("Folder structure built successfully", "Success")
             self.utils.set_status_bar("Folder structure built successfully")
@@ -436,45 +649,159 @@ class FolderBuilder:
 
     def _safe_copy(self, src, dest):
         try:
-            if src.is_file():
-                shutil.copy2(src, dest)
+            if self._is_file(src):
+                _fastcopy(src, dest)
 
                 # Per file logging causes UI lockups on large transmittals — removed for now.
                 # if self.utils:
                 #     self.utils.append_log_action(f"Copied file {src} → {dest}", "Success")
 
         except Exception as e:
+            self._log_queue.append((f"Error copying file {src}: {e}", "Error"))
+
+
+    def _safe_copy_replace(self, src, dest):
+        """
+        Copy to a per-thread '<dest>.<id>.part' and os.replace it over dest, so a
+        half-written drawing is never visible under its final name. Which revision
+        ends up at dest is decided beforehand (see _plan_renamed_copy), not here.
+        """
+        tmp = f"{dest}.{threading.get_ident()}.part"
+        try:
+            if self._is_file(src):
+                _fastcopy(src, tmp)
+                os.replace(tmp, dest)
+
+        except Exception as e:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            self._log_queue.append((f"Error copying file {src}: {e}", "Error"))
+
+
+    def _safe_copy_pair(self, src, dest, second_dest):
+        """
+        Copy src to dest, then make second_dest from the fresh local copy
+        so the source (often a network share) is only read once.
+        """
+        try:
+            if self._is_file(src):
+                _fastcopy(src, dest)
+                _copy_local(dest, second_dest)
+
+        except Exception as e:
+            self._log_queue.append((f"Error copying file {src}: {e}", "Error"))
+
+
+    def _submit_copy(self, src, dest):
+        """Queue a _safe_copy on the copy pool. Destination folders must already exist."""
+        return self._pool.submit(self._safe_copy, src, dest)
+
+
+    def _wait_copies(self, futures):
+        """
+        Block until the given copies finish.
+        _safe_copy logs its own failures; anything else that escapes a worker is logged here.
+        """
+        for future in futures:
+            exc = future.exception()
+            if exc:
+                self._log_queue.append((f"Error copying file: {exc}", "Error"))
+
+        self._flush_log()
+
+
+    def _flush_log(self):
+        """Pass queued worker log lines to utils from the calling (building) thread."""
+        while self._log_queue:
+            message, level = self._log_queue.popleft()
             if self.utils:
-                self.utils.append_log_action(f"Error copying file {src}: {e}", "Error")
+                self.utils.append_log_action(message, level)
+
+
+    def _submit_extract(self, zip_path, names, dest_dir):
+        """
+        Split a zip's members into batches and extract them on the copy pool.
+        Returns the batch futures.
+        """
+        batches = min(COPY_WORKERS, len(names)) or 1
+        return [self._pool.submit(_extract_members, zip_path, names[i::batches], dest_dir)
+                for i in range(batches)]
 
 
     def _safe_copy_dir(self, src, dest):
+        """Queue a folder copy on the copy pool. Returns the file copy futures."""
         try:
-            if src.is_dir() and not dest.is_relative_to(src):
-                shutil.copytree(src, dest, dirs_exist_ok=True)
+            if self._is_dir(src) and not dest.is_relative_to(src):
+                return self._parallel_copytree(src, dest)
 
         except Exception as e:
             print(e)
             if self.utils:
                 self.utils.append_log_action(f"Error copying folder {src}: {e}", "Error")
 
+        return []
 
-    def _rename_and_copy(self, src, dest_dir):
-        clean_name = self._strip_revision(src.name)
-        dest = dest_dir / clean_name
 
-        if dest.exists():
-            if self.utils:
-                self.utils.append_log_action(f"Skipping: File already exists", "Warning")
+    def _parallel_copytree(self, src, dest):
+        """
+        copytree(dirs_exist_ok=True) replacement. Walks src with scandir and creates
+        every destination folder up front, so pool workers only copy file data.
+        """
+        futures = []
+        stack = [(os.fspath(src), os.fspath(dest))]
+        while stack:
+            src_dir, dest_dir = stack.pop()
+            os.makedirs(dest_dir, exist_ok=True)
+
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    target = os.path.join(dest_dir, entry.name)
+                    if entry.is_dir():
+                        stack.append((entry.path, target))
+                    else:
+                        futures.append(self._pool.submit(_fastcopy, entry.path, target))
+
+        return futures
+
 
-        self._safe_copy(src, dest)
-        return dest
+    def _plan_copy(self, planned, src, dest):
+        """
+        Record dest -> src in planned. A later source for the same dest replaces
+        the earlier one - last wins, as when files were copied one after another -
+        so the pool never gets two copies writing the same path.
+        """
+        if dest in planned and self.utils:
+            self.utils.append_log_action(f"Overwriting: {os.path.basename(dest)} already copied from {planned[dest]}", "Warning")
+        planned[dest] = src
+
+
+    def _submit_planned(self, planned):
+        """Queue one _safe_copy per planned destination. Returns the futures."""
+        return [self._submit_copy(src, dest) for dest, src in planned.items()]
+
+
+    def _plan_renamed_copy(self, src, dest_dir, planned):
+        """
+        Record src for dest_dir under its revision-stripped name in planned (dest -> src).
+        A later revision with the same clean name replaces the earlier one, so the
+        last in classifier order wins and only one copy per destination is queued.
+        """
+        clean_name = self._strip_revision(src.name)
+        dest = os.path.join(dest_dir, clean_name)
+
+        self._plan_copy(planned, src, dest)
 
 
 
 # File Naming Helpers
 
-    def _strip_revision(self, filename):
+    # Both naming helpers are pure functions of the filename, so results are memoised
+    # for the life of the agent (re-runs and re-issued transmittals repeat names).
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _strip_revision(filename):
         name, ext = Path(filename).stem, Path(filename).suffix
 
         # Pre-pass: collapse patterns like
@@ -490,12 +817,7 @@ class FolderBuilder:
         # We don't assume anything about <prefix>; we just require:
         #   - three segments separated by " - "
         #   - the middle segment has no digits (looks like a descriptor)
-        part_like_pattern = re.compile(
-            r"^(?P<prefix>.+?)\s*-\s*(?P<desc>[^-]+?)\s*-\s*(?P<rev>rev(?:ision)?[\s_\-]?[a-z0-9]+)\s*$",
-            re.IGNORECASE,
-        )
-
-        m = part_like_pattern.match(name)
+        m = _PART_LIKE_RE.match(name)
         if m:
             desc = m.group("desc").strip()
             # Only treat as a descriptor if it has no digits at all
@@ -504,39 +826,40 @@ class FolderBuilder:
                 name = f"{m.group('prefix').strip()} - {m.group('rev')}"
 
         # General-purpose revision stripping
-        cleaned = re.sub(
-            r"([_\-\s]?rev[\s_\-]?[a-z0-9]+|_[a-z0-9]$)",
-            "",
-            name,
-            flags=re.IGNORECASE
-        )
+        cleaned = _REV_SUB_RE.sub("", name)
 
         cleaned = cleaned.strip("_- ") + ext
         return cleaned
 
 
-    def _detect_bucket(self, filename: str, prefix: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _detect_rev(filename: str):
         """
-        Generic detection of bucket name based on revision identifier.
+        Pull the revision identifier out of a drawing filename, or None.
         Supports both:
           - Standard formats: "Rev A", "Revision 1", "R3"
           - Suffix formats: "_A", "_0", "-1", "-B" (1–2 chars only at end)
         """
-        match = re.search(
-            r"(?:\b(?:rev(?:ision)?\s*[-_.:]*\s*|r(?:\s*[-_.:]+\s*|\s+|(?=[0-9])))([A-Z0-9]+)|[-_]([A-Z0-9]{1,2})(?=\.[^.]+$|$))",
-            filename,
-            re.IGNORECASE
-        )
+        match = _BUCKET_RE.search(filename)
 
         if not match:
-            return f"{prefix} - Unknown"
+            return None
 
         # pick whichever branch matched
         rev = match.group(1) or match.group(2)
         rev = rev.upper().strip()
 
         # Strip random junk at end of revision. I.e (for field)
-        rev = re.split(r"[\s\(\[]", rev)[0]
+        return _JUNK_RE.split(rev)[0]
+
+    @staticmethod
+    def _detect_bucket(filename: str, prefix: str) -> str:
+        """Bucket folder name for a drawing: prefix + revision, e.g. "E1", or "<prefix> - Unknown"."""
+        rev = FolderBuilder._detect_rev(filename)
+
+        if rev is None:
+            return f"{prefix} - Unknown"
 
         return f"{prefix}{rev}"
 
@@ -545,11 +868,49 @@ class FolderBuilder:
         return ["fab", "erection", "field", "parts", "void"]
 
     def _validate_paths(self, classified_files: dict) -> dict:
-        validated = {}
-        for category, files in classified_files.items():
-            validated[category] = [f for f in files if Path(f).exists()]
+        """
+        Drop paths that no longer exist. Each parent folder is listed once with
+        scandir rather than stat-ing every file, and the entry's stat is cached in
+        self._records so the copy helpers don't stat each source a second time.
+        """
+        by_parent = {}
+        for files in classified_files.values():
+            for f in files:
+                if f not in self._records:
+                    by_parent.setdefault(os.path.dirname(os.fspath(f)), []).append(f)
+
+        for parent, files in by_parent.items():
+            try:
+                with os.scandir(parent or ".") as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                entries = None
+
+            for f in files:
+                try:
+                    if entries is None:
+                        st = os.stat(f)
+                    else:
+                        entry = entries.get(os.path.basename(os.fspath(f)))
+                        if entry is None:
+                            continue
+                        st = entry.stat()
+                except OSError:
+                    continue
+                self._records[f] = _FileRec(f, st, S_ISDIR(st.st_mode))
+
+        return {
+            category: [f for f in files if f in self._records]
+            for category, files in classified_files.items()
+        }
+
+    def _is_file(self, path) -> bool:
+        rec = self._records.get(path)
+        return S_ISREG(rec.stat.st_mode) if rec else Path(path).is_file()
 
-        return validated
+    def _is_dir(self, path) -> bool:
+        rec = self._records.get(path)
+        return rec.is_dir if rec else Path(path).is_dir()
 
 
 
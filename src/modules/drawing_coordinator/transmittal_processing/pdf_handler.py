@@ -1,9 +1,12 @@
+import os
 import re
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from PyPDF2 import PdfMerger, PdfReader
-from PyPDF2.generic import DictionaryObject, NumberObject, NameObject, ArrayObject, TextStringObject
+import pikepdf
+
+_NAT_RE = re.compile(r"(\d+)")
 
 
 class PdfHandler:
@@ -21,37 +24,56 @@ class PdfHandler:
         output_path = Path(output_path)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        merger = PdfMerger()
+        cover = pikepdf.new()
+
+        # Sources must stay open until the cover is saved - pages are copied lazily
+        sources = []
 
         # Order: Erection -> Field -> Fab
         cover_order = ["erection", "field", "fab", "void"]
 
         current_page = 0
 
-        for category in cover_order:
-            files = drawings.get(category, [])
-            if not files:
-                continue
+        try:
+            for category in cover_order:
+                files = drawings.get(category, [])
+                if not files:
+                    continue
+
+                sorted_files = sorted(files, key=self.natural_key)
+
+                for file in sorted_files:
+                    # Each drawing is parsed once; the page count comes from the same open
+                    src = pikepdf.open(file)
+                    sources.append(src)
+
+                    page_count = len(src.pages)
+                    if not page_count:
+                        # Nothing to label - a second label at the same index would break /Nums
+                        continue
 
-            sorted_files = sorted(files, key=self.natural_key)
+                    cover.pages.extend(src.pages)
 
-            for file in sorted_files:
-                merger.append(str(file))
+                    # Page label based on filename stem
+                    label = Path(file).stem
+                    self.set_page_label(cover, current_page, label)
 
-                # Page label based on filename stem
-                label = Path(file).stem
-                self.set_page_label(merger, current_page, label)
+                    # Advance page counter
+                    current_page += page_count
 
-                # Advance page counter
-                num_pages = len(PdfReader(str(file)).pages)
-                current_page += num_pages
+            if self.transmittal_type == "IFA":
+                cover_path = output_path / f"{self.job_number} - {self.transmittal_number} IFA.pdf"
+            else:
+                cover_path = output_path / f"{self.job_number} - {self.transmittal_number}.pdf"
 
-        if self.transmittal_type == "IFA":
-            merger.write(output_path / f"{self.job_number} - {self.transmittal_number} IFA.pdf")
-        else:
-            merger.write(output_path / f"{self.job_number} - {self.transmittal_number}.pdf")
+            cover.save(cover_path, object_stream_mode=pikepdf.ObjectStreamMode.generate)
 
-        merger.close()
+        finally:
+            cover.close()
+            for src in sources:
+                src.close()
+
+        return cover_path
 
     def final_fab_check(self, folder_path: Path):
         """Merge fabrication drawings with suffixes like ' - 1.pdf', ' - 2.pdf', etc."""
@@ -61,6 +83,8 @@ class PdfHandler:
         # Match files with " - X.pdf" where X is 1, 2, or 3
         pattern = re.compile(r" - (\d+)\.pdf$")
 
+        # Group every suffix part under its base so each base is opened and written once
+        merges = {}
         for name, path in pdfs.items():
             match = pattern.search(name)
             if not match:
@@ -75,53 +99,70 @@ class PdfHandler:
             base_path = pdfs.get(base_name)
 
             if base_path and base_path.exists():
-                merged_path = fab_folder / base_name
-                merged_path.parent.mkdir(parents=True, exist_ok=True)
-                try:
-                    merger = PdfMerger()
-                    merger.append(str(base_path))
-                    merger.append(str(path))
-                    merger.write(str(merged_path))
-                    merger.close()
+                merges.setdefault(base_path, []).append((suffix_num, path))
+
+        if not merges:
+            return
+
+        # QPDF releases the GIL while reading/writing, so separate bases merge in parallel
+        with ThreadPoolExecutor() as pool:
+            futures = {
+                base_path: pool.submit(self._merge_parts, base_path, [p for _, p in sorted(parts)])
+                for base_path, parts in merges.items()
+            }
+
+        for base_path, future in futures.items():
+            part_names = [p.name for _, p in sorted(merges[base_path])]
+            error = future.exception()
+
+            if error:
+                err_msg = f"Error merging {', '.join(part_names)}: {error}"
+                print(err_msg)
+                if self.utils:
+                    self.utils.append_log_action(err_msg, "Error")
+                    self.utils.set_status_bar("Error merging PDFs")
+                continue
+
+            msg = f"Merged {base_path.name} + {', '.join(part_names)}\nMerged to: {base_path}"
 
-                    path.unlink(missing_ok=True)
+            print(msg)
+            if self.utils:
+                self.utils.append_log_action(msg, "Success")
+                self.utils.set_status_bar("Merged PDFs")
 
-                    msg = f"Merged {base_name} + {name}\nMerged to: {merged_path}"
+    @staticmethod
+    def _merge_parts(base_path: Path, parts: list[Path]):
+        """Append parts to base_path in order, swap the result in, then delete the parts."""
+        merged_path = base_path.with_name(base_path.name + ".merging")
 
-                    print(msg)
-                    if self.utils:
-                        self.utils.append_log_action(msg, "Success")
-                        self.utils.set_status_bar("Merged PDFs")
+        with pikepdf.open(base_path) as merged:
+            sources = [pikepdf.open(part) for part in parts]
+            try:
+                for src in sources:
+                    merged.pages.extend(src.pages)
+                merged.save(merged_path)
+            finally:
+                for src in sources:
+                    src.close()
 
-                except Exception as e:
-                    err_msg = f"Error merging {name}: {e}"
-                    print(err_msg)
-                    if self.utils:
-                        self.utils.append_log_action(err_msg, "Error")
-                        self.utils.set_status_bar("Error merging PDFs")
+        os.replace(merged_path, base_path)
 
+        for part in parts:
+            part.unlink(missing_ok=True)
 
     @staticmethod
     def natural_key(path: Path):
         """Return a natural sort key for filenames like E001, 1234, FW002."""
-        import re
-        return [int(text) if text.isdigit() else text.lower()
-                for text in re.split(r'(\d+)', path.stem)]
+        return tuple(int(text) if text.isdigit() else text
+                     for text in _NAT_RE.split(path.stem.lower()))
 
     @staticmethod
-    def set_page_label(merger, page_index, label):
+    def set_page_label(pdf: pikepdf.Pdf, page_index, label):
         """Apply a label to a specific page."""
-        page_labels = merger.output._root_object.get("/PageLabels")
-        if not page_labels:
-            page_labels = DictionaryObject()
-            page_labels.update({
-                NameObject("/Nums"): ArrayObject()
-            })
-            merger.output._root_object.update({NameObject("/PageLabels"): page_labels})
-
-        nums = page_labels["/Nums"]
-
-        nums.append(NumberObject(page_index))
-        nums.append(DictionaryObject({
-            NameObject("/P"): TextStringObject(label)  # <-- CORRECT FIX
-        }))
\ No newline at end of file
+        if "/PageLabels" not in pdf.Root:
+            pdf.Root.PageLabels = pikepdf.Dictionary(Nums=pikepdf.Array())
+
+        nums = pdf.Root.PageLabels.Nums
+
+        nums.append(page_index)
+        nums.append(pikepdf.Dictionary(P=pikepdf.String(label)))
\ No newline at end of file
@@ -1,11 +1,26 @@
 import re
 import datetime
+from functools import cached_property
 from pathlib import Path
 
 from src.modules.drawing_coordinator.transmittal_processing.zip_handler import ZipHandler
 from src.modules.drawing_coordinator.logger import HeadlessLogger
 
 
+# Dashes and underscores read as spaces for the number patterns - one translate pass
+_NORMALIZE_TABLE = str.maketrans({"-": " ", "_": " "})
+
+
+def _keyword_regex(terms: list[str]) -> re.Pattern:
+    """
+    Compile terms into one alternation that matches if any term is present.
+    A term that contains another term adds nothing to an any-match, so it is
+    dropped - fewer branches for the engine to try at each position.
+    """
+    kept = [t for t in terms if not any(other != t and other in t for other in terms)]
+    return re.compile("|".join(map(re.escape, kept)))
+
+
 class TypeDetector:
     IFA_PATTERNS = [
         "ifa",
@@ -14,7 +29,7 @@ class TypeDetector:
         "approval_dwg",
         "review_set",
     ]
-    IFA_REGEX = [re.compile(r"\brev[\s_\-]*[A-Z]{1,2}\b", re.IGNORECASE)]
+    IFA_REGEX = re.compile(r"\brev[\s_\-]*[A-Z]{1,2}\b", re.IGNORECASE)
 
 
     IFF_PATTERNS = [
@@ -27,21 +42,72 @@ class TypeDetector:
         "fabrication_set",
     ]
 
-    IFF_REGEX = [re.compile(r"rev[\s_\-]*\d+", re.IGNORECASE)]
+    IFF_REGEX = re.compile(r"rev[\s_\-]*\d+", re.IGNORECASE)
+
+    # Each side's keywords folded into one alternation - one C-level scan per name
+    # instead of a Python-level `term in name` per keyword
+    IFA_KEYWORD_REGEX = _keyword_regex(IFA_PATTERNS)
+    IFF_KEYWORD_REGEX = _keyword_regex(IFF_PATTERNS)
+
+    # (pattern, IFA weight, IFF weight) for content scoring:
+    # a keyword is a strong indicator (2), a revision style is a weak one (1)
+    CONTENT_SCORES = [
+        (IFA_KEYWORD_REGEX, 2, 0),
+        (IFA_REGEX, 1, 0),
+        (IFF_KEYWORD_REGEX, 0, 2),
+        (IFF_REGEX, 0, 1),
+    ]
+
+    # Content scan stops early once both numbers are known and one side leads by this much
+    DECISIVE_SCORE_GAP = 4
 
     TRANS_REGEX = re.compile(r"(?:\btransmittal|\btr|\bt)[\s#]*0*(\d{1,3})(?=\b|[^0-9])", re.IGNORECASE)
 
     JOB_NUM_REGEX = re.compile(r"(?<!\d)\d{4}(?!\d)")
 
+    # Splitting on non-digits leaves the digit runs; a run of exactly 4 is a
+    # JOB_NUM_REGEX match, checked with len() instead of the regex engine
+    NON_DIGIT_REGEX = re.compile(r"\D+")
+
 
 
     def __init__(self, zip_path: Path, utils = None):
         self.zip_path = Path(zip_path)
         self.utils = utils
+        self._current_year = f'{datetime.datetime.now().year}'
+
+        # Filled on first use by _scan_contents and shared by all the content fallbacks
+        self._zip_handler = None
+        self._content_scan = None
+        self._detected = None
 
         if zip_path.is_dir():
             raise ValueError(f"TypeDetector expects a ZIP file, got a directory. {self.zip_path}")
 
+    # Each detect_* method starts from the zip name - lowercase / normalise it once
+    @cached_property
+    def _zip_name(self) -> str:
+        return self.zip_path.name.lower()
+
+    @cached_property
+    def _zip_name_normalized(self) -> str:
+        # Remove .zip and normalize separators a bit
+        return self._zip_name.removesuffix(".zip").translate(_NORMALIZE_TABLE)
+
+    # ----------------------------------------------------------------
+    def detect_all(self) -> dict:
+        """
+        Type, transmittal number and job number in one call, keyed like job_data.
+        The three share one read of the ZIP's namelist and a single content scan.
+        """
+        if self._detected is None:
+            self._detected = {
+                "transmittal_type": self.detect_type(),
+                "transmittal_number": self.detect_transmittal_number(),
+                "job_number": self.detect_job_number(),
+            }
+        return self._detected
+
     # ----------------------------------------------------------------
     def detect_type(self) -> str:
         """
@@ -49,17 +115,13 @@ class TypeDetector:
         If no matches are found, falls back to scanning the ZIP's contents.
         """
         detected = "UNKNOWN"
-        zip_name = self.zip_path.name.lower()
+        zip_name = self._zip_name
 
         # 🔹 Check filename patterns first
-        if any(term in zip_name for term in self.IFA_PATTERNS) or any(
-            rgx.search(zip_name) for rgx in self.IFA_REGEX
-        ):
+        if self.IFA_KEYWORD_REGEX.search(zip_name) or self.IFA_REGEX.search(zip_name):
             detected = "IFA"
 
-        elif any(term in zip_name for term in self.IFF_PATTERNS) or any(
-            rgx.search(zip_name) for rgx in self.IFF_REGEX
-        ):
+        elif self.IFF_KEYWORD_REGEX.search(zip_name) or self.IFF_REGEX.search(zip_name):
             detected = "IFF"
 
         else:
@@ -79,19 +141,11 @@ class TypeDetector:
     # ----------------------------------------------------------------
     def detect_job_number(self) -> str:
         detected = "UNKNOWN"
-        zip_name = self.zip_path.name.lower()
-
-        zip_name = zip_name.replace(".zip", "").replace("-", " ").replace("_", " ")
+        zip_name = self._zip_name_normalized
 
         try:
-            matches = self.JOB_NUM_REGEX.findall(zip_name)
             # First, try to get a non-year 4-digit number from the zip filename
-            for match in matches:
-                if match == self._get_current_year():
-                    # Skip year-like matches (e.g. 2025)
-                    continue
-                detected = match
-                break
+            detected = self._find_job_number(zip_name, self._current_year) or detected
 
             # If nothing valid was found in the filename, scan the contents
             if detected == "UNKNOWN":
@@ -109,10 +163,7 @@ class TypeDetector:
 
     def detect_transmittal_number(self) -> str:
         detected = "UNKNOWN"
-        zip_name = self.zip_path.name.lower()
-
-        # Remove .zip and normalize separators a bit
-        zip_name = zip_name.replace(".zip", "").replace("-", " ").replace("_", " ")
+        zip_name = self._zip_name_normalized
 
         try:
             match = self.TRANS_REGEX.search(zip_name)
@@ -137,16 +188,7 @@ class TypeDetector:
         """
         detected = "UNKNOWN"
         try:
-            zip_handler = ZipHandler(self.zip_path)
-            info_list = zip_handler.info_list()
-
-            for file in info_list:
-                lower_name = file.lower().replace("-", " ").replace("_", " ")
-
-                match = self.TRANS_REGEX.search(lower_name)
-                if match:
-                    detected = f"T{int(match.group(1)):03d}"
-                    break
+            detected = self._scan_contents()["transmittal_number"]
 
             if self.utils:
                 self.utils.append_log_action(
@@ -169,28 +211,9 @@ class TypeDetector:
         """
         detected = "UNKNOWN"
         try:
-            zip_handler = ZipHandler(self.zip_path)
-            info_list = zip_handler.info_list()  # list of filenames inside the ZIP
-
-            ifa_score = 0
-            iff_score = 0
-
-            for file in info_list:
-                lower_name = file.lower()
-
-                # IFA checks
-                if any(term in lower_name for term in self.IFA_PATTERNS):
-                    ifa_score += 2   # direct keyword is a strong indicator
-
-                if any(rgx.search(lower_name) for rgx in self.IFA_REGEX):
-                    ifa_score += 1   # revision-letter is a weak indicator
-
-                # IFF checks
-                if any(term in lower_name for term in self.IFF_PATTERNS):
-                    iff_score += 2
-
-                if any(rgx.search(lower_name) for rgx in self.IFF_REGEX):
-                    iff_score += 1
+            scan = self._scan_contents()
+            ifa_score = scan["ifa_score"]
+            iff_score = scan["iff_score"]
 
             if ifa_score > iff_score and ifa_score > 0:
                 detected = "IFA-content"
@@ -220,22 +243,7 @@ class TypeDetector:
         detected = "UNKNOWN"
 
         try:
-            zip_handler = ZipHandler(self.zip_path)
-            info_list = zip_handler.info_list()  # filenames inside ZIP
-
-            for file in info_list:
-                lower_name = file.lower()
-
-                matches = self.JOB_NUM_REGEX.findall(lower_name)
-                for match in matches:
-                    if match == self._get_current_year():
-                        continue
-
-                    detected = match
-                    break
-
-                if detected != "UNKNOWN":
-                    break
+            detected = self._scan_contents()["job_number"]
 
             if self.utils:
                 self.utils.append_log_action(f"Job number detected via contents: {detected}", "Info")
@@ -248,5 +256,73 @@ class TypeDetector:
 
 
 
+    def _scan_contents(self) -> dict:
+        """
+        Walks the ZIP's filenames once and collects everything the content
+        fallbacks need: type scores, the first transmittal number and the first
+        non-year job number. Stops as soon as both numbers are found and the
+        type scores are DECISIVE_SCORE_GAP apart. Cached, so the ZIP is opened
+        and scanned a single time however many fallbacks fire.
+        """
+        if self._content_scan is not None:
+            return self._content_scan
+
+        if self._zip_handler is None:
+            self._zip_handler = ZipHandler(self.zip_path)
+        info_list = self._zip_handler.info_list()  # list of filenames inside the ZIP
+
+        current_year = self._current_year
+        ifa_score = 0
+        iff_score = 0
+        transmittal_number = None
+        job_number = None
+
+        # This loop runs once per ZIP entry - bind the bound methods and constants
+        # to locals up front so each pass skips the attribute lookups.
+        # Kept serial on purpose: `re` holds the GIL so threads gain nothing, a process
+        # pool costs more to start (spawn, in the frozen exe) than scanning even a 10k-entry
+        # namelist, and "first match" numbers plus the early exit need in-order entries.
+        scorers = [(rgx.search, ifa_weight, iff_weight)
+                   for rgx, ifa_weight, iff_weight in self.CONTENT_SCORES]
+        trans_search = self.TRANS_REGEX.search
+        find_job_number = self._find_job_number
+        decisive_gap = self.DECISIVE_SCORE_GAP
+
+        for file in info_list:
+            lower_name = file.lower()
+
+            for search, ifa_weight, iff_weight in scorers:
+                if search(lower_name):
+                    ifa_score += ifa_weight
+                    iff_score += iff_weight
+
+            if transmittal_number is None:
+                match = trans_search(lower_name.translate(_NORMALIZE_TABLE))
+                if match:
+                    transmittal_number = f"T{int(match.group(1)):03d}"
+
+            if job_number is None:
+                job_number = find_job_number(lower_name, current_year)
+
+            # Both numbers found and the type is no longer close - the rest can't change anything useful
+            if transmittal_number and job_number and abs(ifa_score - iff_score) >= decisive_gap:
+                break
+
+        self._content_scan = {
+            "ifa_score": ifa_score,
+            "iff_score": iff_score,
+            "transmittal_number": transmittal_number or "UNKNOWN",
+            "job_number": job_number or "UNKNOWN",
+        }
+        return self._content_scan
+
+    def _find_job_number(self, name: str, current_year: str) -> str | None:
+        """First 4-digit run in name that isn't the current year, or None."""
+        for run in self.NON_DIGIT_REGEX.split(name):
+            # Skip year-like matches (e.g. 2025)
+            if len(run) == 4 and run != current_year:
+                return run
+        return None
+
     def _get_current_year(self) -> str:
-        return f'{datetime.datetime.now().year}'
+        return self._current_year
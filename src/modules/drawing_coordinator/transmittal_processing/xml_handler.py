@@ -1,25 +1,31 @@
 # src/core/xml_handler.py
+import re
 from pathlib import Path
 
+# Directory tags rewritten to the new folder layout. Kept as UTF-8 bytes so files
+# are matched and patched without a decode/encode round-trip.
+_XML_PATTERNS = {
+    b"<CNCDirectory>\\CNC</CNCDirectory>": b"<CNCDirectory>\\CNC Data\\NC-DXF Combined</CNCDirectory>",
+    b"<DrawingDirectory>\\Drawings</DrawingDirectory>": b"<DrawingDirectory>\\Drawings\\Fabrication</DrawingDirectory>",
+}
+
+# One alternation so the file is walked once for every tag
+_XML_REGEX = re.compile(b"|".join(re.escape(k) for k in _XML_PATTERNS))
+
+
 class XMLHandler:
     def __init__(self, logger=None):
         self.logger = logger
 
     def process_xml_file(self, xml_file: Path):
         try:
-            text = xml_file.read_text(encoding="utf-8")
-
-            # Perform replacements
-            text = text.replace(
-                "<CNCDirectory>\\CNC</CNCDirectory>",
-                "<CNCDirectory>\\CNC Data\\NC-DXF Combined</CNCDirectory>"
-            )
-            text = text.replace(
-                "<DrawingDirectory>\\Drawings</DrawingDirectory>",
-                "<DrawingDirectory>\\Drawings\\Fabrication</DrawingDirectory>"
-            )
-
-            xml_file.write_text(text, encoding="utf-8")
+            raw = xml_file.read_bytes()
+
+            # Most XMLs carry neither tag - a bytes `in` check rejects them before any regex work
+            if any(tag in raw for tag in _XML_PATTERNS):
+                # Perform replacements
+                raw = _XML_REGEX.sub(lambda m: _XML_PATTERNS[m.group(0)], raw)
+                xml_file.write_bytes(raw)
 
             if self.logger:
                 self.logger.append_log_action(f"Patched XML: {xml_file.name}", "Success")
@@ -1,27 +1,119 @@
+import os
+import time
 import zipfile
 import tempfile
 import shutil
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from src.modules.drawing_coordinator.logger import HeadlessLogger
 
+# Members stream out through a 1 MiB buffer - the stdlib default is 64 KiB off Windows
+_EXTRACT_BUFSIZE = 1 << 20
+
+# Characters Windows won't accept in a filename, replaced the same way extractall does
+_WINDOWS_ILLEGAL = str.maketrans(':<>|"?*', "_" * 7)
+
+
+def _member_target(root: str, filename: str) -> str:
+    """
+    Destination path for a zip member under root, sanitised like
+    ZipFile.extractall: drive/absolute prefixes and '.'/'..' parts are dropped.
+    """
+    arcname = filename.replace("/", os.sep)
+    if os.altsep:
+        arcname = arcname.replace(os.altsep, os.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+
+    parts = [x for x in arcname.split(os.sep) if x not in ("", os.curdir, os.pardir)]
+    if os.sep == "\\":
+        parts = [x.translate(_WINDOWS_ILLEGAL).rstrip(".") for x in parts]
+        parts = [x for x in parts if x]
+
+    return os.path.normpath(os.path.join(root, *parts))
+
+
+def _iter_zips(root: Path):
+    """
+    Yield the .zip files under root in the same order as root.rglob("*.zip"),
+    but from scandir entries rather than a pathlib stat per entry.
+    Symlinked folders are not followed.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        folder = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(".zip"):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+        # Reversed so the first sub-folder is walked next, as rglob does
+        stack.extend(reversed(subdirs))
+
+
+def _extract_all(zip_ref: zipfile.ZipFile, dest: Path):
+    """
+    Streaming extractall: one makedirs per folder, a 1 MiB copy buffer,
+    and each file keeps the modified time stored in the zip. That last part
+    differs from extractall, which leaves files with the extraction time;
+    the files and their contents are the same.
+    """
+    root = os.fspath(dest)
+    made_dirs = set()
+
+    for info in zip_ref.infolist():
+        target = _member_target(root, info.filename)
+        folder = target if info.is_dir() else os.path.dirname(target)
+
+        if folder not in made_dirs:
+            os.makedirs(folder, exist_ok=True)
+            made_dirs.add(folder)
+
+        if info.is_dir():
+            continue
+
+        with zip_ref.open(info) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, _EXTRACT_BUFSIZE)
+
+        try:
+            mtime = time.mktime(info.date_time + (0, 0, -1))
+            os.utime(target, (mtime, mtime))
+        except (OverflowError, ValueError, OSError):
+            pass
+
+
 class ZipHandler:
 
     def __init__(self, input_zip_file: str | Path, utils = None):
         self.input_zip_file = input_zip_file
         self.utils = utils
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="TransmitPro_"))
+        # Created on first extract() - detection-only handlers never touch the disk
+        self.temp_dir = None
+        self._namelist = None
+
+
+    def _ensure_temp_dir(self) -> Path:
+        if self.temp_dir is None:
+            self.temp_dir = Path(tempfile.mkdtemp(prefix="TransmitPro_"))
+        return self.temp_dir
 
 
     def extract(self) -> Path:
         try:
+            temp_dir = self._ensure_temp_dir()
             with zipfile.ZipFile(self.input_zip_file, "r") as zip_ref:
-                zip_ref.extractall(self.temp_dir)
+                _extract_all(zip_ref, temp_dir)
             if self.utils:
                 self.utils.set_status_bar("Zip extracted successfully")
                 self.utils.append_log_action("Zip extracted successfully", "Success")
 
-            self._extract_nested_zips(self.temp_dir)
-            return self.temp_dir.resolve()
+            self._extract_nested_zips(temp_dir)
+            return temp_dir.resolve()
 
         except zipfile.BadZipFile:
             if self.utils:
@@ -36,6 +128,9 @@ class ZipHandler:
 
 
     def cleanup(self):
+        if self.temp_dir is None:
+            return
+
         try:
             shutil.rmtree(self.temp_dir)
             if self.utils:
@@ -48,8 +143,11 @@ class ZipHandler:
 
 
     def info_list(self) -> list:
-        with zipfile.ZipFile(self.input_zip_file, "r") as zip_ref:
-            return zip_ref.namelist()
+        # Read the central directory once per handler - callers may ask repeatedly
+        if self._namelist is None:
+            with zipfile.ZipFile(self.input_zip_file, "r") as zip_ref:
+                self._namelist = zip_ref.namelist()
+        return self._namelist
 
     def copy_path(self, path: str):
         """Pass the full path to the specified location back"""
@@ -58,17 +156,51 @@ class ZipHandler:
         return [og_path, copy_path]
 
     def _extract_nested_zips(self, temp_dir: Path):
-        for zip_file in temp_dir.rglob("*.zip"):
+        """
+        Extract nested zips (and zips inside those) on a small thread pool.
+        Each zip lands in '<root>/<zip stem>', where root is the folder being scanned
+        (temp_dir, then each freshly extracted folder) - not the subfolder the zip was
+        found in. Zips that share a target folder are extracted one after another by
+        a single task, so no two workers ever write the same folder.
+        """
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            pending = {pool.submit(self._extract_nested_group, extract_dir, zip_files)
+                       for extract_dir, zip_files in self._group_nested_zips(temp_dir).items()}
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    extract_dir = future.result()
+                    if extract_dir is None:
+                        continue
+
+                    # Anything this extraction produced may hold zips of its own
+                    pending |= {pool.submit(self._extract_nested_group, nested_dir, zip_files)
+                                for nested_dir, zip_files in self._group_nested_zips(extract_dir).items()}
+
+    @staticmethod
+    def _group_nested_zips(root: Path) -> dict:
+        """Map each target folder under root to the zips that extract into it, in walk order."""
+        groups = {}
+        for zip_file in _iter_zips(root):
+            groups.setdefault((root / zip_file.stem).resolve(), []).append(zip_file)
+        return groups
+
+    def _extract_nested_group(self, extract_dir: Path, zip_files: list):
+        """Extract zip_files into extract_dir. Returns extract_dir if anything was extracted."""
+        extracted = False
+        for zip_file in zip_files:
             try:
-                extract_dir = (temp_dir / zip_file.stem).resolve()
                 extract_dir.mkdir(exist_ok=True)
                 with zipfile.ZipFile(zip_file, "r") as nested_zip_ref:
-                    nested_zip_ref.extractall(extract_dir)
+                    _extract_all(nested_zip_ref, extract_dir)
+                extracted = True
 
                 if self.utils:
                     self.utils.append_log_action(f"Extracted nested zip: {zip_file}", "Success")
 
-                self._extract_nested_zips(extract_dir)
             except Exception as e:
                 if self.utils:
-                    self.utils.append_log_action(f"Error extracting nested zip: {zip_file}: {e}", "Error")
\ No newline at end of file
+                    self.utils.append_log_action(f"Error extracting nested zip: {zip_file}: {e}", "Error")
+
+        return extract_dir if extracted else None
@@ -1,19 +1,171 @@
 import os
 import shutil
+import asyncio
+import codecs
+import errno
+import sys
+import time
 import fnmatch
-import aiofiles
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from operator import itemgetter
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 from typing import Optional
 from src.modules.base import BaseModule
 from src.utils.logger import get_logger
 
 logger = get_logger("filesystem")
 
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _CopyFileExW = _kernel32.CopyFileExW
+    _CopyFileExW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p,
+                             ctypes.c_void_p, ctypes.POINTER(wintypes.BOOL), wintypes.DWORD]
+    _CopyFileExW.restype = wintypes.BOOL
+
+    # Bulk directory enumeration: FindExInfoBasic skips the 8.3 short name
+    # lookup and FIND_FIRST_EX_LARGE_FETCH asks for bigger batches per
+    # round trip, which is what makes the difference on network shares
+    _FindFirstFileExW = _kernel32.FindFirstFileExW
+    _FindFirstFileExW.argtypes = [wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(wintypes.WIN32_FIND_DATAW),
+                                  ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]
+    _FindFirstFileExW.restype = wintypes.HANDLE
+    _FindNextFileW = _kernel32.FindNextFileW
+    _FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+    _FindNextFileW.restype = wintypes.BOOL
+    _FindClose = _kernel32.FindClose
+    _FindClose.argtypes = [wintypes.HANDLE]
+    _FindClose.restype = wintypes.BOOL
+
+    _FIND_EX_INFO_BASIC = 1
+    _FIND_FIRST_EX_LARGE_FETCH = 2
+    _INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+    _ERROR_NO_MORE_FILES = 18
+    _FILE_ATTRIBUTE_DIRECTORY = 0x10
+    _FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+    _IO_REPARSE_TAG_SYMLINK = 0xA000000C
+    _EPOCH_AS_FILETIME = 116444736000000000
+
+    def _find_entries(path):
+        """
+        Yield (name, attributes, reparse_tag, size, mtime) for each entry in
+        path using one FindFirstFileExW/FindNextFileW enumeration.
+        mtime is computed the way os.stat does it on Windows.
+        """
+        data = wintypes.WIN32_FIND_DATAW()
+        handle = _FindFirstFileExW(os.path.join(path, "*"), _FIND_EX_INFO_BASIC, ctypes.byref(data),
+                                   0, None, _FIND_FIRST_EX_LARGE_FETCH)
+        if handle == _INVALID_HANDLE_VALUE:
+            raise ctypes.WinError(ctypes.get_last_error())
+        try:
+            while True:
+                name = data.cFileName
+                if name != "." and name != "..":
+                    written = (data.ftLastWriteTime.dwHighDateTime << 32) | data.ftLastWriteTime.dwLowDateTime
+                    sec, ticks = divmod(written - _EPOCH_AS_FILETIME, 10_000_000)
+                    yield (
+                        name,
+                        data.dwFileAttributes,
+                        data.dwReserved0,
+                        (data.nFileSizeHigh << 32) | data.nFileSizeLow,
+                        sec + ticks * 100 * 1e-9
+                    )
+                if not _FindNextFileW(handle, ctypes.byref(data)):
+                    error = ctypes.get_last_error()
+                    if error != _ERROR_NO_MORE_FILES:
+                        raise ctypes.WinError(error)
+                    break
+        finally:
+            _FindClose(handle)
+else:
+    _CopyFileExW = None
+    _find_entries = None
+
+# Tree walks fan out per top-level subdirectory once there are more than this many
+PARALLEL_WALK_MIN_DIRS = 4
+WALK_WORKERS = min(8, os.cpu_count() or 1)
+# Concurrent tree walks (directory_tree, search_files); each may hold WALK_WORKERS threads and fds
+MAX_CONCURRENT_WALKS = 4
+
+# File reads/writes get their own pool so a burst of tool calls doesn't queue
+# behind long jobs (folder dialogs, distribution copies) on the default executor
+IO_WORKERS = 8
+_io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="fs-io")
+
+# scandir(fd) is POSIX-only; on Windows DirEntry.stat() is already free
+_SCANDIR_FD = os.scandir in os.supports_fd
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+
+@contextmanager
+def _scandir_at(dir_path: str):
+    """
+    os.scandir(dir_path), listed through a directory fd where supported so
+    DirEntry.stat()/is_dir() are fstatat calls relative to it instead of
+    full path lookups. Stat entries inside the block; entry.path is just
+    the name in the fd case, so join paths from dir_path.
+    """
+    dir_fd = os.open(dir_path, _DIR_OPEN_FLAGS) if _SCANDIR_FD else None
+    try:
+        with os.scandir(dir_path if dir_fd is None else dir_fd) as it:
+            yield it
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+# Compiled search patterns kept between calls, see _name_matcher
+PATTERN_CACHE_MAX = 128
+
+# '*.ext' style globs - matched with endswith instead of a regex
+_SUFFIX_GLOB_RE = re.compile(r"^\*+(\.[A-Za-z0-9]+)$")
+
+# directory_tree order: directories first, then case-insensitive name
+_TREE_SORT_KEY = itemgetter(0, 1)
+
+# Largest text payload read_file returns in one response (WebSocket limit)
+MAX_READ_BYTES = 5 * 1024 * 1024
+
+# Validation stats are reused for this long - enough to cover a tool chain
+# like get_file_info -> read_file -> file_exists on the same path
+STAT_CACHE_TTL = 0.2
+STAT_CACHE_MAX = 1024
+
+# Parent folders write_file has already created or found (see _ensure_parent)
+KNOWN_DIRS_MAX = 1024
+
+
+def _invalidates_stats(method):
+    """Drop cached validation stats once a mutating operation finishes (even on error)."""
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self._stat_cache.clear()
+    return wrapper
+
 
 class FileSystemModule(BaseModule):
     """Filesystem operations module."""
     name = 'filesystem'
 
+    # Shared by all instances so parallel tree requests queue instead of
+    # exhausting threads and file handles
+    _walk_slots = asyncio.Semaphore(MAX_CONCURRENT_WALKS)
+
+    def __init__(self):
+        # abspath -> (monotonic time, stat_result or None if missing), see _classify
+        self._stat_cache: dict[str, tuple[float, Optional[os.stat_result]]] = {}
+        # abspaths of directories known to exist, see _ensure_parent
+        self._known_dirs: set[str] = set()
+
     # =========================================================================
     # Directory Operations
     # =========================================================================
@@ -22,30 +174,13 @@ class FileSystemModule(BaseModule):
         """List contents of a directory."""
         logger.debug(f"Listing directory: {path}")
         try:
-            p = Path(path)
-            if not p.exists():
+            st, is_dir, _ = self._classify(path)
+            if st is None:
                 return self._error(f"Path does not exist: {path}")
-            if not p.is_dir():
+            if not is_dir:
                 return self._error(f"Path is not a directory: {path}")
 
-            entries = []
-            for entry in p.iterdir():
-                try:
-                    stat = entry.stat()
-                    entries.append({
-                        "name": entry.name,
-                        "is_dir": entry.is_dir(),
-                        "size": stat.st_size if entry.is_file() else None,
-                        "modified": stat.st_mtime
-                    })
-                except (PermissionError, OSError) as e:
-                    # Skip entries we can't stat
-                    entries.append({
-                        "name": entry.name,
-                        "is_dir": entry.is_dir(),
-                        "size": None,
-                        "error": str(e)
-                    })
+            entries = await asyncio.to_thread(self._scan_directory, path)
 
             return self._success(entries=entries, count=len(entries))
         except PermissionError:
@@ -55,6 +190,7 @@ class FileSystemModule(BaseModule):
 
 
 
+    @_invalidates_stats
     async def create_directory(self, path: str, parents: bool = True) -> dict:
         """
         Create a directory.
@@ -67,8 +203,9 @@ class FileSystemModule(BaseModule):
         try:
             p = Path(path)
             
-            if p.exists():
-                if p.is_dir():
+            st, is_dir, _ = self._classify(p)
+            if st is not None:
+                if is_dir:
                     return self._success(
                         path=str(p),
                         created=False,
@@ -112,71 +249,19 @@ class FileSystemModule(BaseModule):
         logger.debug(f"Building directory tree: {path} (max_depth={max_depth}, include_files={include_files}, include_hidden={include_hidden})")
         try:
             p = Path(path)
-            if not p.exists():
+            st, is_dir, _ = self._classify(p)
+            if st is None:
                 return self._error(f"Path does not exist: {path}")
-            if not p.is_dir():
+            if not is_dir:
                 return self._error(f"Path is not a directory: {path}")
             
             # Cap max_depth to prevent runaway recursion
             max_depth = min(max_depth, 10)
             
-            def build_tree(current_path: Path, depth: int) -> Optional[dict]:
-                """Recursively build tree structure."""
-                if depth > max_depth:
-                    return None
-                
-                name = current_path.name or str(current_path)
-                
-                # Skip hidden files/folders if not included
-                if not include_hidden and name.startswith('.'):
-                    return None
-                
-                if current_path.is_file():
-                    if not include_files:
-                        return None
-                    try:
-                        size = current_path.stat().st_size
-                    except (PermissionError, OSError):
-                        size = None
-                    return {
-                        "name": name,
-                        "type": "file",
-                        "size": size
-                    }
-                
-                elif current_path.is_dir():
-                    children = []
-                    try:
-                        for child in sorted(current_path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower())):
-                            child_node = build_tree(child, depth + 1)
-                            if child_node is not None:
-                                children.append(child_node)
-                    except PermissionError:
-                        pass  # Skip directories we can't read
-                    
-                    return {
-                        "name": name,
-                        "type": "directory",
-                        "children": children
-                    }
-                
-                return None
-            
-            tree = build_tree(p, 0)
-            
-            # Count totals
-            def count_items(node: dict) -> tuple[int, int]:
-                """Returns (file_count, dir_count)"""
-                if node["type"] == "file":
-                    return (1, 0)
-                files, dirs = 0, 1
-                for child in node.get("children", []):
-                    f, d = count_items(child)
-                    files += f
-                    dirs += d
-                return (files, dirs)
-            
-            file_count, dir_count = count_items(tree) if tree else (0, 0)
+            async with self._walk_slots:
+                tree, file_count, dir_count = await asyncio.to_thread(
+                    self._walk_tree, p, max_depth, include_files, include_hidden
+                )
             dir_count -= 1  # Don't count root
             
             return self._success(
@@ -191,18 +276,22 @@ class FileSystemModule(BaseModule):
 
 
 
+    @_invalidates_stats
     async def delete_directory(self, path: str, recursive: bool = False) -> dict:
         """Delete a directory. If recursive=True, deletes contents too."""
         logger.warning(f"Deleting directory: {path} (recursive={recursive})")
         try:
             p = Path(path)
-            if not p.exists():
+            st, is_dir, _ = self._classify(p)
+            if st is None:
                 return self._error(f"Directory does not exist: {path}")
-            if not p.is_dir():
+            if not is_dir:
                 return self._error(f"Path is not a directory: {path}")
             
+            self._forget_dirs(path)
             if recursive:
-                shutil.rmtree(path)
+                async with self._walk_slots:
+                    await asyncio.to_thread(self._remove_tree, path)
             else:
                 os.rmdir(path)  # Only works if empty
             
@@ -222,32 +311,64 @@ class FileSystemModule(BaseModule):
     # File Operations
     # =========================================================================
 
-    async def read_file(self, path: str, encoding: str = 'utf-8') -> dict:
-        """Read contents of a text file."""
-        logger.debug(f"Reading file: {path}")
+    async def read_file(
+        self,
+        path: str,
+        encoding: str = 'utf-8',
+        offset: int = 0,
+        length: Optional[int] = None
+    ) -> dict:
+        """
+        Read contents of a text file.
+        
+        Args:
+            path: File path to read
+            encoding: File encoding (default utf-8)
+            offset: Byte position to start reading from (default 0)
+            length: Maximum bytes to read (default and cap 5MB)
+            
+        A plain read of a file over 5MB returns its first 5MB with
+        truncated=True instead of failing. Ranged reads report next_offset,
+        the byte position to continue from; a character split by the range
+        end is left for the next read.
+        """
+        logger.debug(f"Reading file: {path} (offset={offset}, length={length})")
         try:
-            p = Path(path)
-            if not p.exists():
+            st, _, is_file = self._classify(path)
+            if st is None:
                 return self._error(f"File does not exist: {path}")
-            if not p.is_file():
+            if not is_file:
                 return self._error(f"Path is not a file: {path}")
+            if offset < 0:
+                return self._error(f"offset must be >= 0 (got {offset})")
+            if length is not None and length <= 0:
+                return self._error(f"length must be > 0 (got {length})")
             
-            size = p.stat().st_size
+            size = st.st_size
             
-            # Limit file size to prevent oversized WebSocket responses (5MB)
-            if size > 5 * 1024 * 1024:
-                return self._error(
-                    f"File too large for WebSocket transfer ({size:,} bytes). "
-                    f"Maximum is 5MB. Consider reading specific sections."
+            # Whole-file read, within the WebSocket response limit
+            if offset == 0 and length is None and size <= MAX_READ_BYTES:
+                content = await self._run_io(self._read_text, path, encoding)
+                
+                return self._success(
+                    content=content,
+                    size=size,
+                    encoding=encoding
                 )
             
-            async with aiofiles.open(path, 'r', encoding=encoding) as f:
-                content = await f.read()
+            # Ranged read - never more than MAX_READ_BYTES per response
+            length = min(length or MAX_READ_BYTES, MAX_READ_BYTES)
+            content, next_offset = await self._run_io(
+                self._read_text_range, path, encoding, offset, length, size
+            )
             
             return self._success(
                 content=content,
                 size=size,
-                encoding=encoding
+                encoding=encoding,
+                offset=offset,
+                next_offset=next_offset,
+                truncated=next_offset < size
             )
         except UnicodeDecodeError:
             return self._error(f"Cannot read file as text (encoding: {encoding}). File may be binary.")
@@ -258,6 +379,7 @@ class FileSystemModule(BaseModule):
 
 
 
+    @_invalidates_stats
     async def write_file(self, path: str, content: str, encoding: str = 'utf-8', append: bool = False) -> dict:
         """Write content to a file. Creates parent directories if needed.
 
@@ -271,15 +393,17 @@ class FileSystemModule(BaseModule):
         logger.info(f"{'Appending to' if append else 'Writing to'} file: {path} | content_size={content_size} bytes")
         try:
             p = Path(path)
-            p.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_parent(p)
 
             mode = 'a' if append else 'w'
             logger.debug(f"Opening file with mode='{mode}', encoding='{encoding}'")
 
-            async with aiofiles.open(path, mode, encoding=encoding) as f:
-                await f.write(content)
-
-            size = p.stat().st_size
+            try:
+                size = await self._run_io(self._write_text, path, content, mode, encoding)
+            except FileNotFoundError:
+                # The remembered parent was removed behind our back - recreate it once
+                self._ensure_parent(p, force=True)
+                size = await self._run_io(self._write_text, path, content, mode, encoding)
             logger.info(f"Write complete: {path} | final_size={size} bytes")
 
             return self._success(path=str(p), bytes_written=size, appended=append)
@@ -292,6 +416,7 @@ class FileSystemModule(BaseModule):
 
 
 
+    @_invalidates_stats
     async def edit_file(
         self,
         path: str,
@@ -314,30 +439,20 @@ class FileSystemModule(BaseModule):
         logger.info(f"Editing file: {path}")
         try:
             p = Path(path)
-            if not p.exists():
+            st, _, is_file = self._classify(p)
+            if st is None:
                 return self._error(f"File does not exist: {path}")
-            if not p.is_file():
+            if not is_file:
                 return self._error(f"Path is not a file: {path}")
             
-            # Read current content
-            async with aiofiles.open(path, 'r', encoding=encoding) as f:
-                content = await f.read()
-            
-            # Count occurrences
-            count = content.count(old_text)
+            # Read, check and rewrite in one I/O-pool hop
+            count = await self._run_io(self._replace_once, path, old_text, new_text, encoding)
             
             if count == 0:
                 return self._error(f"Text not found in file. Make sure the text matches exactly, including whitespace.")
             if count > 1:
                 return self._error(f"Text appears {count} times in file. It must be unique for safe replacement. Add more context to make it unique.")
             
-            # Perform replacement
-            new_content = content.replace(old_text, new_text, 1)
-            
-            # Write back
-            async with aiofiles.open(path, 'w', encoding=encoding) as f:
-                await f.write(new_content)
-            
             return self._success(
                 path=str(p),
                 old_text_length=len(old_text),
@@ -353,14 +468,16 @@ class FileSystemModule(BaseModule):
 
 
 
+    @_invalidates_stats
     async def delete_file(self, path: str) -> dict:
         """Delete a file."""
         logger.warning(f"Deleting file: {path}")
         try:
             p = Path(path)
-            if not p.exists():
+            st, _, is_file = self._classify(p)
+            if st is None:
                 return self._error(f"File does not exist: {path}")
-            if not p.is_file():
+            if not is_file:
                 return self._error(f"Path is not a file: {path}. Use delete_directory for directories.")
             
             os.remove(path)
@@ -372,6 +489,7 @@ class FileSystemModule(BaseModule):
 
 
 
+    @_invalidates_stats
     async def copy_file(self, source: str, destination: str) -> dict:
         """
         Copy a file to a new location.
@@ -388,25 +506,26 @@ class FileSystemModule(BaseModule):
             src = Path(source)
             dst = Path(destination)
             
-            if not src.exists():
+            src_st, _, src_is_file = self._classify(src)
+            if src_st is None:
                 return self._error(f"Source file does not exist: {source}")
-            if not src.is_file():
+            if not src_is_file:
                 return self._error(f"Source is not a file: {source}. Use copy_directory for directories.")
             
             # If destination is a directory, copy into it
-            if dst.is_dir():
+            if self._classify(dst)[1]:
                 dst = dst / src.name
             
             # Create parent directories if needed
             dst.parent.mkdir(parents=True, exist_ok=True)
             
-            # Perform copy
-            shutil.copy2(source, str(dst))  # copy2 preserves metadata
+            # Perform copy (keeps timestamps, like copy2)
+            await self._run_io(self._copy_with_metadata, source, str(dst))
             
             return self._success(
                 source=str(src),
                 destination=str(dst),
-                size=dst.stat().st_size
+                size=src_st.st_size
             )
         except PermissionError:
             return self._error(f"Permission denied")
@@ -415,6 +534,7 @@ class FileSystemModule(BaseModule):
 
 
 
+    @_invalidates_stats
     async def move_file(self, source: str, destination: str) -> dict:
         """
         Move or rename a file or directory.
@@ -432,27 +552,35 @@ class FileSystemModule(BaseModule):
             src = Path(source)
             dst = Path(destination)
             
-            if not src.exists():
+            src_st, src_is_dir, _ = self._classify(src)
+            if src_st is None:
                 return self._error(f"Source does not exist: {source}")
             
             # If destination is an existing directory, move into it
-            if dst.is_dir():
+            if self._classify(dst)[1]:
                 dst = dst / src.name
             
             # Create parent directories if needed
             dst.parent.mkdir(parents=True, exist_ok=True)
             
-            # Check if destination already exists
-            if dst.exists():
+            # Check if destination already exists. Windows' rename refuses to
+            # replace a target by itself, and _rename_or_move checks before a
+            # cross-volume copy; POSIX rename would silently overwrite
+            if os.name != 'nt' and self._classify(dst)[0] is not None:
                 return self._error(f"Destination already exists: {destination}")
             
             # Perform move
-            shutil.move(str(src), str(dst))
+            if src_is_dir:
+                self._forget_dirs(source)
+            try:
+                await self._run_io(self._rename_or_move, str(src), str(dst))
+            except FileExistsError:
+                return self._error(f"Destination already exists: {destination}")
             
             return self._success(
                 source=str(src),
                 destination=str(dst),
-                is_dir=dst.is_dir()
+                is_dir=src_is_dir
             )
         except PermissionError:
             return self._error(f"Permission denied")
@@ -488,77 +616,51 @@ class FileSystemModule(BaseModule):
         logger.debug(f"Searching files in: {path} | pattern={pattern} | max_results={max_results} | include_hidden={include_hidden}")
         try:
             p = Path(path)
-            if not p.exists():
+            st, is_dir, _ = self._classify(p)
+            if st is None:
                 return self._error(f"Path does not exist: {path}")
-            if not p.is_dir():
+            if not is_dir:
                 return self._error(f"Path is not a directory: {path}")
             
             max_results = min(max_results, 500)
-            results = []
             
             # Determine if pattern is a glob or simple search
             is_glob = any(c in pattern for c in ['*', '?', '[', ']'])
             
-            if is_glob:
-                # Use glob pattern
-                # If pattern doesn't include path separators, search recursively
-                if '/' not in pattern and '\\' not in pattern:
-                    # Make it recursive by default for simple patterns like *.py
-                    search_pattern = f"**/{pattern}"
+            # Walks share the directory_tree slots (each may fan out)
+            async with self._walk_slots:
+                if is_glob:
+                    plan = self._split_glob(pattern)
+                    if plan is not None:
+                        # Only the last segment has wildcards: walk the literal
+                        # prefix directory and match entry names against one
+                        # compiled regex (same rules Path.glob applies to a segment)
+                        prefix, name_pattern, recursive = plan
+                        if not include_hidden and any(part.startswith('.') for part in prefix):
+                            results = []
+                        elif not os.path.isdir(os.path.join(str(p), *prefix)):
+                            results = []
+                        else:
+                            matcher = self._name_matcher(name_pattern)
+                            results = await asyncio.to_thread(
+                                self._search_tree if recursive else self._search_one_dir,
+                                os.path.join(str(p), *prefix), matcher, False, include_hidden, max_results
+                            )
+                    else:
+                        results = await asyncio.to_thread(
+                            self._glob_matches, p, pattern, include_hidden, max_results
+                        )
                 else:
-                    search_pattern = pattern
-                
-                for match in p.glob(search_pattern):
-                    if len(results) >= max_results:
-                        break
-                    
-                    # Skip hidden if not included
-                    if not include_hidden and any(part.startswith('.') for part in match.parts):
-                        continue
-                    
-                    try:
-                        stat = match.stat()
-                        results.append({
-                            "path": str(match),
-                            "name": match.name,
-                            "is_dir": match.is_dir(),
-                            "size": stat.st_size if match.is_file() else None,
-                            "modified": stat.st_mtime
-                        })
-                    except (PermissionError, OSError):
-                        continue
-            else:
-                # Simple substring search in filenames
-                pattern_lower = pattern.lower()
-                
-                for root, dirs, files in os.walk(path):
-                    if len(results) >= max_results:
-                        break
-                    
-                    # Skip hidden directories
-                    if not include_hidden:
-                        dirs[:] = [d for d in dirs if not d.startswith('.')]
-                    
-                    for filename in files:
-                        if len(results) >= max_results:
-                            break
-                        
-                        if not include_hidden and filename.startswith('.'):
-                            continue
-                        
-                        if pattern_lower in filename.lower():
-                            filepath = Path(root) / filename
-                            try:
-                                stat = filepath.stat()
-                                results.append({
-                                    "path": str(filepath),
-                                    "name": filename,
-                                    "is_dir": False,
-                                    "size": stat.st_size,
-                                    "modified": stat.st_mtime
-                                })
-                            except (PermissionError, OSError):
-                                continue
+                    # Simple substring search in filenames
+                    pattern_lower = pattern.lower()
+                    results = await asyncio.to_thread(
+                        self._search_tree,
+                        str(p),
+                        lambda name: pattern_lower in name.lower(),
+                        True,
+                        include_hidden,
+                        max_results
+                    )
             
             return self._success(
                 matches=results,
@@ -577,9 +679,10 @@ class FileSystemModule(BaseModule):
         logger.debug(f"Checking existence: {path}")
         try:
             p = Path(path)
-            exists = p.exists()
-            is_file = p.is_file() if exists else None
-            is_dir = p.is_dir() if exists else None
+            st, is_dir, is_file = self._classify(p, trust_missing=True)
+            exists = st is not None
+            if not exists:
+                is_file = is_dir = None
             
             return self._success(
                 path=str(p),
@@ -597,16 +700,15 @@ class FileSystemModule(BaseModule):
         logger.debug(f"Getting file info: {path}")
         try:
             p = Path(path)
-            if not p.exists():
+            stat, is_dir, is_file = self._classify(p, trust_missing=True)
+            if stat is None:
                 return self._error(f"Path does not exist: {path}")
             
-            stat = p.stat()
-            
             return self._success(
                 path=str(p),
                 name=p.name,
-                is_file=p.is_file(),
-                is_dir=p.is_dir(),
+                is_file=is_file,
+                is_dir=is_dir,
                 size=stat.st_size,
                 created=stat.st_ctime,
                 modified=stat.st_mtime,
@@ -616,3 +718,683 @@ class FileSystemModule(BaseModule):
             return self._error(f"Permission denied: {path}")
         except Exception as e:
             return self._error(str(e))
+
+
+
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+
+    def _classify(self, path, trust_missing: bool = False) -> tuple[Optional[os.stat_result], bool, bool]:
+        """
+        One stat in place of the exists()/is_dir()/is_file() chain.
+        Returns (stat, is_dir, is_file); stat is None if the path is missing.
+        Permission errors propagate like they did from Path.exists().
+
+        Results are reused for STAT_CACHE_TTL seconds; every mutating
+        operation clears the cache when it finishes. Misses are cached too,
+        but only trusted by the pure probes (file_exists, get_file_info) -
+        anything about to act on a path re-checks one it last saw missing.
+        """
+        key = os.path.abspath(path)
+        now = time.monotonic()
+        cached = self._stat_cache.get(key)
+        if cached is not None and now - cached[0] < STAT_CACHE_TTL and (cached[1] is not None or trust_missing):
+            st = cached[1]
+        else:
+            try:
+                st = os.stat(path)
+            except PermissionError:
+                raise
+            except OSError:
+                st = None
+            if len(self._stat_cache) >= STAT_CACHE_MAX:
+                self._stat_cache.clear()
+            self._stat_cache[key] = (now, st)
+
+        if st is None:
+            return None, False, False
+        return st, S_ISDIR(st.st_mode), S_ISREG(st.st_mode)
+
+
+
+    def _ensure_parent(self, p: Path, force: bool = False) -> None:
+        """mkdir -p the parent of p, skipped when it is already known to exist."""
+        parent = os.path.abspath(p.parent)
+        if not force and parent in self._known_dirs:
+            return
+        p.parent.mkdir(parents=True, exist_ok=True)
+        if len(self._known_dirs) >= KNOWN_DIRS_MAX:
+            self._known_dirs.clear()
+        self._known_dirs.add(parent)
+
+
+
+    def _forget_dirs(self, path: str) -> None:
+        """Drop path and everything below it from the known-directories set."""
+        root = os.path.abspath(path)
+        prefix = os.path.join(root, '')
+        self._known_dirs = {
+            d for d in self._known_dirs
+            if d != root and not d.startswith(prefix)
+        }
+
+
+
+    @staticmethod
+    def _remove_tree(path: str) -> None:
+        """
+        shutil.rmtree, with the top-level subdirectories removed on their
+        own threads when there are more than a handful of them. The first
+        failure is re-raised once every subtree has been attempted.
+        """
+        with os.scandir(path) as it:
+            subdirs = [
+                entry.path for entry in it
+                if entry.is_dir(follow_symlinks=False)
+            ]
+
+        if len(subdirs) > PARALLEL_WALK_MIN_DIRS:
+            with ThreadPoolExecutor(max_workers=WALK_WORKERS) as pool:
+                futures = [pool.submit(shutil.rmtree, d) for d in subdirs]
+            for future in futures:
+                future.result()
+
+        # Remaining files (and everything, when run serially), then the root
+        shutil.rmtree(path)
+
+
+
+    @staticmethod
+    async def _run_io(func, *args):
+        """Run a blocking file helper on the dedicated I/O pool."""
+        return await asyncio.get_running_loop().run_in_executor(_io_pool, func, *args)
+
+
+
+    @staticmethod
+    def _copy_with_metadata(src: str, dst: str) -> None:
+        """
+        Windows: CopyFileExW - one in-kernel call (server-side on SMB shares)
+        that also carries over timestamps and attributes.
+        Elsewhere: copyfile (sendfile/fcopyfile fast path) + copystat - what
+        copy2 does, minus its isdir probe; copy_file has already resolved dst
+        to a file path.
+        """
+        if _CopyFileExW is not None:
+            if not _CopyFileExW(src, dst, None, None, None, 0):
+                raise ctypes.WinError(ctypes.get_last_error())
+            return
+        shutil.copyfile(src, dst)
+        shutil.copystat(src, dst)
+
+
+
+    @staticmethod
+    def _rename_or_move(src: str, dst: str) -> None:
+        """
+        One rename for same-volume moves. Only a cross-volume move falls back
+        to shutil.move's copy-and-delete - other errors (a file locked by
+        another process, say) are raised instead of attempting a copy.
+        The copy would overwrite an existing dst, so that is refused first.
+        """
+        try:
+            os.rename(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            if os.path.lexists(dst):
+                raise FileExistsError(errno.EEXIST, "Destination already exists", dst) from e
+            shutil.move(src, dst)
+
+
+
+    @staticmethod
+    def _read_text(path: str, encoding: str) -> str:
+        """
+        Callers gate on the stat size first. An unsized text read is already
+        a single fstat-sized readall plus one decode with newline translation
+        in C; a binary os.read + decode + replace() measured slower on CRLF files.
+        """
+        with open(path, 'r', encoding=encoding) as f:
+            return f.read()
+
+
+
+    @staticmethod
+    def _read_text_range(path: str, encoding: str, offset: int, length: int, size: int) -> tuple[str, int]:
+        """
+        Decode up to length bytes from offset. Returns (text, next_offset).
+        An incomplete trailing character - or a CR that may be the first
+        half of a CRLF - is held back, then newlines are translated the way
+        text mode does it, so consecutive ranges join up seamlessly.
+        """
+        with open(path, 'rb') as f:
+            # BOM-sniffing codecs (utf-16, utf-8-sig) need the file's own
+            # BOM to decode a range that starts mid-file
+            bom = f.read(len(''.encode(encoding))) if offset else b''
+            f.seek(offset)
+            data = f.read(length)
+
+            while True:
+                at_eof = offset + len(data) >= size
+                decoder = codecs.getincrementaldecoder(encoding)()
+                decoder.decode(bom)
+                text = decoder.decode(data, final=at_eof)
+                consumed = len(data) - len(decoder.getstate()[0])
+                # A range too short for one whole character (or a lone CR)
+                # would never advance - widen it until it does
+                if at_eof or (text and text != '\r'):
+                    break
+                more = f.read(4)
+                if not more:
+                    at_eof = True
+                    text += decoder.decode(b'', final=True)
+                    consumed = len(data)
+                    break
+                data += more
+
+        if not at_eof and len(text) > 1 and text.endswith('\r'):
+            text = text[:-1]
+            # Byte width of one CR (the difference cancels any BOM)
+            consumed -= len('\r\r'.encode(encoding)) - len('\r'.encode(encoding))
+
+        return text.replace('\r\n', '\n').replace('\r', '\n'), offset + consumed
+
+
+
+    @staticmethod
+    def _write_text(path: str, content: str, mode: str, encoding: str) -> int:
+        """
+        Write content and return the resulting file size. Once flushed, the
+        binary position is the file size in both modes ('a' starts at EOF),
+        BOMs and newline translation included - no stat needed afterwards.
+        """
+        with open(path, mode, encoding=encoding) as f:
+            f.write(content)
+            f.flush()
+            return f.buffer.tell()
+
+
+
+    @staticmethod
+    def _replace_once(path: str, old_text: str, new_text: str, encoding: str) -> int:
+        """
+        Replace old_text in the file only if it occurs exactly once.
+        Returns the occurrence count; the file is untouched unless it is 1.
+        Uniqueness is settled with two finds that stop at the second hit -
+        the full count is only taken to word the error.
+        The new content goes to a '<file>.<thread id>.part' sibling that is
+        os.replace'd over the original, so readers never see a half-written
+        file. If the original can't be replaced (Windows refuses while another
+        process holds it open), it is rewritten in place as before.
+        """
+        target = os.path.realpath(path)
+        with open(target, 'r', encoding=encoding) as f:
+            content = f.read()
+            mode = os.fstat(f.fileno()).st_mode
+
+        # The search stays on decoded text, not raw bytes: text mode folds
+        # CRLF to LF (so old_text written with \n matches CRLF files), the
+        # decode is what rejects binary files, and byte offsets aren't safe
+        # for encodings like UTF-16. It runs on the I/O pool, off the loop.
+        start = content.find(old_text)
+        if start < 0:
+            return 0
+        end = start + len(old_text)
+        if content.find(old_text, end) >= 0:
+            return content.count(old_text)
+
+        content = content[:start] + new_text + content[end:]
+        tmp = f"{target}.{threading.get_ident()}.part"
+        try:
+            with open(tmp, 'w', encoding=encoding) as f:
+                f.write(content)
+            os.chmod(tmp, mode)
+            os.replace(tmp, target)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            with open(target, 'w', encoding=encoding) as f:
+                f.write(content)
+        return 1
+
+
+
+    @staticmethod
+    def _scan_directory(path: str) -> list[dict]:
+        """
+        Blocking half of list_directory - runs in a worker thread.
+        DirEntry caches its stat, so each entry costs one stat at most
+        (type and size both come from the same result).
+        On Windows the listing comes from _scan_directory_bulk instead.
+        """
+        if _find_entries is not None:
+            return FileSystemModule._scan_directory_bulk(path)
+
+        entries = []
+        with _scandir_at(path) as it:
+            for entry in it:
+                try:
+                    stat = entry.stat()
+                    entries.append({
+                        "name": entry.name,
+                        "is_dir": S_ISDIR(stat.st_mode),
+                        "size": stat.st_size if S_ISREG(stat.st_mode) else None,
+                        "modified": stat.st_mtime
+                    })
+                except (PermissionError, OSError) as e:
+                    # Skip entries we can't stat. The type comes from the
+                    # directory listing itself - asking is_dir() to follow
+                    # the link would just retry the stat that failed
+                    if e.filename == entry.name:
+                        e.filename = os.path.join(path, entry.name)  # fd-relative stat
+                    entries.append({
+                        "name": entry.name,
+                        "is_dir": entry.is_dir(follow_symlinks=False),
+                        "size": None,
+                        "error": str(e)
+                    })
+        return entries
+
+
+
+    @staticmethod
+    def _scan_directory_bulk(path: str) -> list[dict]:
+        """
+        Windows listing straight from the find data: type, size and mtime
+        arrive with the name, so only symlinks are stat'ed (to report their
+        target, as DirEntry.stat() does).
+        """
+        entries = []
+        for name, attributes, reparse_tag, size, modified in _find_entries(path):
+            is_link = (attributes & _FILE_ATTRIBUTE_REPARSE_POINT
+                       and reparse_tag == _IO_REPARSE_TAG_SYMLINK)
+            if not is_link:
+                is_dir = bool(attributes & _FILE_ATTRIBUTE_DIRECTORY)
+                entries.append({
+                    "name": name,
+                    "is_dir": is_dir,
+                    "size": None if is_dir else size,
+                    "modified": modified
+                })
+                continue
+
+            try:
+                stat = os.stat(os.path.join(path, name))
+                entries.append({
+                    "name": name,
+                    "is_dir": S_ISDIR(stat.st_mode),
+                    "size": stat.st_size if S_ISREG(stat.st_mode) else None,
+                    "modified": stat.st_mtime
+                })
+            except (PermissionError, OSError) as e:
+                entries.append({
+                    "name": name,
+                    "is_dir": False,
+                    "size": None,
+                    "error": str(e)
+                })
+        return entries
+
+
+
+    @staticmethod
+    def _walk_tree(
+        root: Path,
+        max_depth: int,
+        include_files: bool,
+        include_hidden: bool
+    ) -> tuple[Optional[dict], int, int]:
+        """
+        Blocking half of directory_tree - runs in a worker thread.
+        The root is listed first; when it has more than a handful of
+        subdirectories each one is walked on its own thread, since the
+        time goes to scandir/stat calls that release the GIL.
+        Returns (tree, file_count, dir_count), the root included in dir_count.
+        """
+        name = root.name or str(root)
+        if not include_hidden and name.startswith('.'):
+            return None, 0, 0
+
+        tree = {"name": name, "type": "directory", "children": []}
+        if max_depth < 1:
+            return tree, 0, 1
+
+        subdirs = FileSystemModule._scan_tree_dir(
+            str(root), tree["children"], include_files, include_hidden
+        )
+        file_count = len(tree["children"]) - len(subdirs)
+        dir_count = 1 + len(subdirs)
+        work = [(dir_path, children, 1) for dir_path, children in subdirs]
+
+        def walk(item):
+            return FileSystemModule._fill_tree([item], max_depth, include_files, include_hidden)
+
+        if len(work) > PARALLEL_WALK_MIN_DIRS:
+            with ThreadPoolExecutor(max_workers=WALK_WORKERS) as pool:
+                counts = list(pool.map(walk, work))
+        else:
+            counts = [FileSystemModule._fill_tree(work[::-1], max_depth, include_files, include_hidden)]
+
+        for files, dirs in counts:
+            file_count += files
+            dir_count += dirs
+        return tree, file_count, dir_count
+
+
+
+    @staticmethod
+    def _fill_tree(stack: list, max_depth: int, include_files: bool, include_hidden: bool) -> tuple[int, int]:
+        """
+        Depth-first walk of (dir_path, children, depth) items, filling each
+        children list. Returns the (file_count, dir_count) it added.
+        """
+        file_count = dir_count = 0
+        while stack:
+            dir_path, children, depth = stack.pop()
+            # Children of a node at max_depth are past the limit
+            if depth >= max_depth:
+                continue
+
+            subdirs = FileSystemModule._scan_tree_dir(dir_path, children, include_files, include_hidden)
+            file_count += len(children) - len(subdirs)
+            dir_count += len(subdirs)
+            stack.extend((sub_path, sub_children, depth + 1) for sub_path, sub_children in subdirs)
+        return file_count, dir_count
+
+
+
+    @staticmethod
+    def _scan_tree_dir(
+        dir_path: str,
+        children: list,
+        include_files: bool,
+        include_hidden: bool
+    ) -> list[tuple[str, list]]:
+        """
+        List one directory into children, sorted directories-first.
+        Entries are classified once from the DirEntry and sorted on that
+        cached flag; only files pay for a stat (for their size). On Windows
+        that stat comes free with the find data; on POSIX it is an fstatat
+        against the listing fd, and wide trees overlap them on the walk pool.
+        Returns (path, children) for each subdirectory still to be filled.
+        """
+        batch = []
+        subdirs = []
+        try:
+            with _scandir_at(dir_path) as it:
+                for entry in it:
+                    if not include_hidden and entry.name.startswith('.'):
+                        continue
+                    try:
+                        is_dir = entry.is_dir()
+                        is_file = not is_dir and entry.is_file()
+                    except OSError:
+                        is_dir = is_file = False
+                    if is_dir or (is_file and include_files):
+                        batch.append((not is_dir, entry.name.lower(), entry))
+
+                # Key on (is_file, lower name) only - DirEntry itself isn't orderable
+                batch.sort(key=_TREE_SORT_KEY)
+                base = os.path.join(dir_path, '')
+                for is_file, _, entry in batch:
+                    if is_file:
+                        try:
+                            size = entry.stat().st_size
+                        except (PermissionError, OSError):
+                            size = None
+                        children.append({
+                            "name": entry.name,
+                            "type": "file",
+                            "size": size
+                        })
+                    else:
+                        node = {"name": entry.name, "type": "directory", "children": []}
+                        children.append(node)
+                        subdirs.append((base + entry.name, node["children"]))
+        except PermissionError:
+            return []  # Skip directories we can't read
+        return subdirs
+
+
+
+    @staticmethod
+    def _search_tree(
+        root: str,
+        matches,
+        files_only: bool,
+        include_hidden: bool,
+        max_results: int
+    ) -> list[dict]:
+        """
+        Blocking half of search_files - runs in a worker thread.
+        Walks top-down like os.walk (symlinked directories are listed but
+        not descended into) and stats only the entries whose name matches.
+
+        With more than a handful of top-level subdirectories, each subtree
+        is searched on its own thread and the results are stitched back in
+        listing order, so the output (and where it gets truncated) matches
+        a serial walk. Once the first max_results are in, the remaining
+        subtrees are told to stop.
+        """
+        results = []
+        subdirs = FileSystemModule._search_dir(
+            root, matches, files_only, include_hidden, results, max_results
+        )
+        if len(results) >= max_results or not subdirs:
+            return results
+
+        remaining = max_results - len(results)
+        if len(subdirs) <= PARALLEL_WALK_MIN_DIRS:
+            results.extend(FileSystemModule._search_subtree(
+                subdirs[::-1], matches, files_only, include_hidden, remaining
+            ))
+            return results
+
+        stop = threading.Event()
+        with ThreadPoolExecutor(max_workers=WALK_WORKERS) as pool:
+            futures = [
+                pool.submit(
+                    FileSystemModule._search_subtree,
+                    [subdir], matches, files_only, include_hidden, remaining, stop
+                )
+                for subdir in subdirs
+            ]
+            for future in futures:
+                results.extend(future.result())
+                if len(results) >= max_results:
+                    stop.set()
+                    break
+
+        return results[:max_results]
+
+
+
+    @staticmethod
+    def _search_subtree(
+        stack: list[str],
+        matches,
+        files_only: bool,
+        include_hidden: bool,
+        max_results: int,
+        stop: Optional[threading.Event] = None
+    ) -> list[dict]:
+        """Depth-first search from the directories on stack (last one first)."""
+        results = []
+        while stack and len(results) < max_results:
+            if stop is not None and stop.is_set():
+                break
+            subdirs = FileSystemModule._search_dir(
+                stack.pop(), matches, files_only, include_hidden, results, max_results
+            )
+            # Reversed so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
+        return results
+
+
+
+    @staticmethod
+    def _search_dir(
+        dir_path: str,
+        matches,
+        files_only: bool,
+        include_hidden: bool,
+        results: list,
+        max_results: int
+    ) -> list[str]:
+        """
+        List one directory, appending hits to results (up to max_results).
+        Returns the subdirectories to descend into.
+
+        Where scandir accepts a directory fd (POSIX), the listing goes
+        through one, so DirEntry.stat() becomes an fstatat relative to it
+        rather than a fresh lookup of the full path for every hit.
+        """
+        try:
+            dir_fd = os.open(dir_path, _DIR_OPEN_FLAGS) if _SCANDIR_FD else None
+        except OSError:
+            return []  # Skip directories we can't read
+
+        try:
+            try:
+                with os.scandir(dir_path if dir_fd is None else dir_fd) as it:
+                    entries = list(it)
+            except OSError:
+                return []
+
+            base = os.path.join(dir_path, '')
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                if not include_hidden and name.startswith('.'):
+                    continue
+
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir and not entry.is_symlink():
+                    subdirs.append(base + name)
+
+                if (files_only and is_dir) or not matches(name):
+                    continue
+
+                try:
+                    stat = entry.stat()
+                except (PermissionError, OSError):
+                    continue
+                results.append({
+                    "path": base + name,
+                    "name": name,
+                    "is_dir": S_ISDIR(stat.st_mode),
+                    "size": stat.st_size if S_ISREG(stat.st_mode) else None,
+                    "modified": stat.st_mtime
+                })
+                if len(results) >= max_results:
+                    break
+            return subdirs
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+
+
+    @staticmethod
+    def _split_glob(pattern: str) -> Optional[tuple[list[str], str, bool]]:
+        """
+        Split a glob into (literal directory parts, name pattern, recursive).
+
+        Patterns without separators search recursively (*.py == **/*.py).
+        Returns None when a directory part has wildcards of its own, the
+        pattern is absolute or it ends in a separator - Path.glob handles those.
+        """
+        if '/' not in pattern and '\\' not in pattern:
+            return None if '**' in pattern else ([], pattern, True)
+
+        seps = (os.sep, os.altsep) if os.altsep else (os.sep,)
+        if pattern.endswith(seps) or os.path.isabs(pattern) or os.path.splitdrive(pattern)[0]:
+            return None
+
+        if os.altsep:
+            pattern = pattern.replace(os.altsep, os.sep)
+        parts = [part for part in pattern.split(os.sep) if part not in ('', '.')]
+        if not parts:
+            return None
+
+        *prefix, name_pattern = parts
+        recursive = bool(prefix) and prefix[-1] == '**'
+        if recursive:
+            prefix.pop()
+        if '**' in name_pattern or any(c in part for part in prefix for c in '*?['):
+            return None
+        return prefix, name_pattern, recursive
+
+
+
+    @staticmethod
+    @lru_cache(maxsize=PATTERN_CACHE_MAX)
+    def _name_matcher(name_pattern: str):
+        """
+        Name test for one glob segment, with the rules Path.glob uses
+        (case-insensitive on Windows). The common '*.ext' form is a plain
+        endswith; anything else is one compiled fnmatch regex. Cached, as
+        agents tend to repeat the same pattern call after call.
+        """
+        suffix = _SUFFIX_GLOB_RE.match(name_pattern)
+        if suffix is not None:
+            ext = suffix.group(1)
+            if os.name == 'nt':
+                ext = ext.lower()
+                return lambda name: name.lower().endswith(ext)
+            return lambda name: name.endswith(ext)
+
+        flags = re.IGNORECASE if os.name == 'nt' else 0
+        return re.compile(fnmatch.translate(name_pattern), flags).fullmatch
+
+
+
+    @staticmethod
+    def _search_one_dir(
+        dir_path: str,
+        matches,
+        files_only: bool,
+        include_hidden: bool,
+        max_results: int
+    ) -> list[dict]:
+        """Non-recursive counterpart of _search_tree (sub/*.py)."""
+        results = []
+        FileSystemModule._search_dir(dir_path, matches, files_only, include_hidden, results, max_results)
+        return results
+
+
+
+    @staticmethod
+    def _glob_matches(root: Path, pattern: str, include_hidden: bool, max_results: int) -> list[dict]:
+        """Path.glob fallback for patterns that span directories (sub/*.py)."""
+        results = []
+        hidden_marker = os.sep + '.'
+        for match in root.glob(pattern):
+            if len(results) >= max_results:
+                break
+            
+            # Skip hidden if not included - some component starts with '.',
+            # checked on the string rather than by splitting match.parts
+            match_path = str(match)
+            if not include_hidden and (hidden_marker in match_path or match_path.startswith('.')):
+                continue
+            
+            try:
+                stat = match.stat()
+                results.append({
+                    "path": match_path,
+                    "name": match.name,
+                    "is_dir": S_ISDIR(stat.st_mode),
+                    "size": stat.st_size if S_ISREG(stat.st_mode) else None,
+                    "modified": stat.st_mtime
+                })
+            except (PermissionError, OSError):
+                continue
+        return results
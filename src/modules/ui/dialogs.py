@@ -2,10 +2,19 @@
 UI operations module for native dialogs.
 """
 import asyncio
+import threading
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog
 from src.modules.base import BaseModule
 
+# Tk objects may only be used from the thread that created them, so every
+# dialog runs on this one thread - which also keeps dialogs from overlapping.
+# The hidden root lives in a thread-local, created on first use and reused,
+# so it is torn down by its own thread when the pool shuts down.
+_dialog_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ui-dialog")
+_tk = threading.local()
+
 
 class UIModule(BaseModule):
     """Handles native UI dialogs."""
@@ -16,9 +25,9 @@ class UIModule(BaseModule):
         Returns selected path or None if cancelled.
         """
         try:
-            # Run tkinter in a thread to avoid blocking
+            # Run tkinter on the dialog thread to avoid blocking
             loop = asyncio.get_event_loop()
-            path = await loop.run_in_executor(None, self._show_folder_dialog, title)
+            path = await loop.run_in_executor(_dialog_pool, self._show_folder_dialog, title)
             
             if path:
                 return self._success(path=path)
@@ -28,18 +37,33 @@ class UIModule(BaseModule):
         except Exception as e:
             return self._error(f"Failed to show folder picker: {e}")
 
-    def _show_folder_dialog(self, title: str) -> str:
-        """Show the actual folder dialog (runs in thread)."""
-        # Create hidden root window
+    @staticmethod
+    def _get_root() -> tk.Tk:
+        """Hidden root window, created once per dialog thread."""
+        root = getattr(_tk, "root", None)
+        try:
+            if root is not None and root.winfo_exists():
+                return root
+        except tk.TclError:
+            pass  # Destroyed underneath us - make a new one
+
         root = tk.Tk()
         root.withdraw()
-        root.attributes('-topmost', True)  # Bring dialog to front
-        
+        root.attributes('-topmost', True)  # Bring dialogs to front
+        _tk.root = root
+        return root
+
+    def _show_folder_dialog(self, title: str) -> str:
+        """Show the actual folder dialog (runs on the dialog thread)."""
+        root = self._get_root()
+
         # Show folder picker
         folder_path = filedialog.askdirectory(
+            parent=root,
             title=title,
             mustexist=True
         )
-        
-        root.destroy()
+
+        # Let Tk finish closing the dialog; the root stays for the next call
+        root.update()
         return folder_path
@@ -1,18 +1,27 @@
 import yaml
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
+# libyaml's C loader when PyYAML was built with it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Config:
     """
     Configuration loader for the FabCore Agent.
     
-    Loads settings from config.yml in the project root.
+    Loads settings from config.yml in the project root. Files are parsed
+    on first access rather than at import.
     """
-    
-    def __init__(self):
-        self._config = self._load_config()
-        self._update_config = self._load_update_config()
+
+    @cached_property
+    def _config(self) -> dict:
+        return self._load_config()
+
+    @cached_property
+    def _update_config(self) -> dict:
+        return self._load_update_config()
 
     def _load_config(self) -> dict:
         """Load main configuration file."""
@@ -22,7 +31,7 @@ class Config:
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=SafeLoader) or {}
 
     def _load_update_config(self) -> dict:
         """Load update configuration file (optional)."""
@@ -35,7 +44,7 @@ class Config:
         for config_path in possible_paths:
             if config_path.exists():
                 with open(config_path, 'r') as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=SafeLoader)
                     return data.get("updates", {}) if data else {}
         
         # Return defaults if no config found
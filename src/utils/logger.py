@@ -4,15 +4,107 @@ Centralized logging utility for FabCore Agent.
 Provides file-based logging to logs/ops.log in the agent's data directory,
 with support for console output and structured log entries.
 """
+import atexit
 import logging
 import os
+import queue
 import sys
+import threading
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from functools import cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
 
+# File log batching - see BatchedRotatingFileHandler
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 1.0  # seconds
+
+
+class BatchedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that batches writes.
+    
+    Records collect in a 64KB buffer and are flushed at most once per
+    LOG_FLUSH_INTERVAL by a timer - or straight away for WARNING and
+    above, so problems are on disk before a crash can lose them. The file
+    size for rollover is tracked as records are written (in characters,
+    like the stock check) instead of seeking the stream per record, which
+    would also force a flush.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self._size = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        stream = open(
+            self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+            encoding=self.encoding, errors=self.errors
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:  # delay=True: doRollover leaves it closed
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+            
+            if record.levelno >= logging.WARNING:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(LOG_FLUSH_INTERVAL, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _timed_flush(self):
+        self._flush_timer = None
+        self.flush()
+    
+    def close(self):
+        timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+        super().close()
+
+
+class _StartingQueueHandler(QueueHandler):
+    """QueueHandler that runs on_first_record before queueing its first record."""
+    
+    def __init__(self, log_queue, on_first_record):
+        super().__init__(log_queue)
+        self._on_first_record = on_first_record
+    
+    def enqueue(self, record: logging.LogRecord):
+        if self._on_first_record is not None:
+            self._on_first_record()
+            self._on_first_record = None
+        super().enqueue(record)
+
+
+@cache
+def _compute_log_dir() -> Path:
+    """Directory for ops.log (not created here)."""
+    if getattr(sys, "frozen", False):
+        # Running as exe - use AppData
+        return Path(os.environ.get("LOCALAPPDATA", ".")) / "FabCore" / "Agent" / "logs"
+    # Running as script - use project root
+    return Path(__file__).parent.parent.parent / "logs"
+
+
 class AgentLogger:
     """
     Centralized logger for all agent operations.
@@ -42,33 +134,46 @@ class AgentLogger:
         
         AgentLogger._initialized = True
         
-        # Determine log directory
-        if getattr(sys, "frozen", False):
-            # Running as exe - use AppData
-            self.log_dir = Path(os.environ.get("LOCALAPPDATA", ".")) / "FabCore" / "Agent" / "logs"
-        else:
-            # Running as script - use project root
-            self.log_dir = Path(__file__).parent.parent.parent / "logs"
-        
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.log_dir = _compute_log_dir()
         self.log_file = self.log_dir / "ops.log"
         
-        # Create the logger
+        # Create the logger. Handlers are attached now; the log directory and
+        # the writer thread wait for the first record, see _start_listener
         self._logger = logging.getLogger("FabCoreAgent")
         self._logger.setLevel(logging.DEBUG)
+        self._listener_started = False
+        self._listener_lock = threading.Lock()
         
         # Prevent duplicate handlers if called multiple times
         if not self._logger.handlers:
             self._setup_handlers()
     
+    def _start_listener(self):
+        """Create the log directory and start the writer thread, once."""
+        with self._listener_lock:
+            if self._listener_started:
+                return
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            self._listener.start()
+            atexit.register(self._listener.stop)  # Drain the queue on exit
+            self._listener_started = True
+    
     def _setup_handlers(self):
-        """Configure file and console handlers."""
+        """
+        Configure file and console handlers.
+        
+        Both sit behind a QueueListener: logging calls only enqueue the
+        record, and one background thread does the writes, so callers
+        (including the event loop) never wait on disk or console I/O.
+        The listener is started by the first record queued, not here.
+        """
         # File handler with rotation (5MB max, keep 3 backups)
-        file_handler = RotatingFileHandler(
+        file_handler = BatchedRotatingFileHandler(
             self.log_file,
             maxBytes=5 * 1024 * 1024,  # 5MB
             backupCount=3,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True  # Opened by the first record
         )
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
@@ -84,42 +189,64 @@ class AgentLogger:
             "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
         )
         console_handler.setFormatter(console_formatter)
+        # websockets records share the queue but go to the file only
+        console_handler.addFilter(logging.Filter(self._logger.name))
+        
+        # Records reach the handlers through one queue
+        log_queue = queue.SimpleQueue()
+        queue_handler = _StartingQueueHandler(log_queue, self._start_listener)
+        self._listener = QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
         
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
+        self._logger.addHandler(queue_handler)
 
         # Capture websockets library warnings/errors
         ws_logger = logging.getLogger("websockets")
         ws_logger.setLevel(logging.WARNING)
-        ws_logger.addHandler(file_handler)
+        ws_logger.addHandler(queue_handler)
     
     # =========================================================================
     # Standard logging methods
     # =========================================================================
     
+    @property
+    def debug_enabled(self) -> bool:
+        """
+        Whether debug records are currently kept. Lets hot call sites skip
+        building an expensive message (f-string, repr of a large object).
+        """
+        return self._logger.isEnabledFor(logging.DEBUG)
+    
     def debug(self, msg: str, *args, **kwargs):
         """Log debug message."""
-        self._logger.debug(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(msg, *args, **kwargs)
     
     def info(self, msg: str, *args, **kwargs):
         """Log info message."""
-        self._logger.info(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(msg, *args, **kwargs)
     
     def warning(self, msg: str, *args, **kwargs):
         """Log warning message."""
-        self._logger.warning(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(msg, *args, **kwargs)
     
     def error(self, msg: str, *args, **kwargs):
         """Log error message."""
-        self._logger.error(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(msg, *args, **kwargs)
     
     def exception(self, msg: str, *args, **kwargs):
         """Log error with exception traceback."""
-        self._logger.exception(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.exception(msg, *args, **kwargs)
     
     def critical(self, msg: str, *args, **kwargs):
         """Log critical message."""
-        self._logger.critical(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._logger.critical(msg, *args, **kwargs)
     
     # =========================================================================
     # Structured logging helpers
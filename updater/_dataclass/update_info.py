@@ -1,12 +1,64 @@
+import hashlib
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)  # Not frozen: UpdateManager sets force on received updates
 class UpdateInfo:
     version: str
     force: bool
     changelog: str
     download_url: str
     checksum: Optional[str] = None
-    min_version: Optional[str] = None
\ No newline at end of file
+    min_version: Optional[str] = None
+
+    def _parse_checksum(self) -> tuple[str, str]:
+        """Split checksum into (algorithm, hex digest); a bare digest is sha256."""
+        algo, sep, digest = self.checksum.partition(":")
+        if not sep:
+            algo, digest = "sha256", self.checksum
+        return algo.lower(), digest.lower()
+
+    def new_hasher(self):
+        """
+        Fresh hash object for checksum's algorithm, or None when there is no
+        checksum. Feed it the download as it arrives, then call matches().
+        """
+        if not self.checksum:
+            return None
+
+        algo, _ = self._parse_checksum()
+        if algo == "blake3":
+            try:
+                import blake3
+            except ImportError:
+                raise RuntimeError("blake3 checksum given but the blake3 package is not installed")
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return hashlib.new(algo)
+
+    def matches(self, hasher) -> bool:
+        """True if a hasher from new_hasher() produced the expected digest."""
+        return hasher.hexdigest() == self._parse_checksum()[1]
+
+    def verify(self, path: Path) -> bool:
+        """
+        Check a downloaded file against checksum.
+
+        checksum is '<algorithm>:<hex digest>' (e.g. 'blake3:...',
+        'sha256:...'); a bare digest is taken as sha256. blake3 is hashed
+        multi-threaded over an mmap when the blake3 package is installed;
+        anything else goes through hashlib.file_digest's C read loop.
+        Returns True when there is no checksum to compare against.
+        """
+        hasher = self.new_hasher()
+        if hasher is None:
+            return True
+
+        if hasattr(hasher, "update_mmap"):
+            hasher.update_mmap(path)
+        else:
+            with open(path, "rb") as f:
+                hasher = hashlib.file_digest(f, lambda: hasher)
+
+        return self.matches(hasher)
@@ -10,36 +10,79 @@ Usage:
 """
 
 import argparse
+import atexit
 import logging
 import os
+import queue
 import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from stat import S_ISDIR
+from typing import Optional
 
 # Configure logging
 LOG_FILE = Path(os.environ.get("LOCALAPPDATA", ".")) / "FabCore" / "Agent" / "update.log"
-LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+if not LOG_FILE.parent.is_dir():  # One stat on every run after the first
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+# Records are queued and written by a listener thread, so the copy workers
+# never block on the log file or console
+_log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+_log_handlers = [logging.FileHandler(LOG_FILE, mode='w', delay=True), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Drain the queue before exit
 
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE, mode='w'),
-        logging.StreamHandler()
-    ]
+    format="%(message)s",  # Formatted by the listener's handlers
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _CopyFileExW = _kernel32.CopyFileExW
+    _CopyFileExW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p,
+                             ctypes.c_void_p, ctypes.POINTER(wintypes.BOOL), wintypes.DWORD]
+    _CopyFileExW.restype = wintypes.BOOL
+
+    # Waiting on a process handle without psutil
+    SYNCHRONIZE = 0x00100000
+    WAIT_OBJECT_0 = 0
+    _OpenProcess = _kernel32.OpenProcess
+    _OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _OpenProcess.restype = wintypes.HANDLE
+    _WaitForSingleObject = _kernel32.WaitForSingleObject
+    _WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _WaitForSingleObject.restype = wintypes.DWORD
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+else:
+    _CopyFileExW = None
+
 
-def wait_for_process_exit(exe_path: str, timeout: int = 30) -> bool:
+def wait_for_process_exit(exe_path: str, timeout: int = 30, pid: Optional[int] = None) -> bool:
     """
     Wait for the main application to exit.
     
     Args:
         exe_path: Path to the executable to wait for
         timeout: Maximum seconds to wait
+        pid: PID of the agent, when the launcher passed it - waited on
+             directly instead of looking the process up by name
         
     Returns:
         True if process exited, False if timeout
@@ -49,34 +92,45 @@ def wait_for_process_exit(exe_path: str, timeout: int = 30) -> bool:
         has_psutil = True
     except ImportError:
         has_psutil = False
-        logger.warning("psutil not available, using simple delay instead")
+        logger.warning("psutil not available, waiting on --pid or a simple delay instead")
     
     exe_name = Path(exe_path).name.lower()
     start_time = time.time()
     
-    logger.info(f"Waiting for {exe_name} to exit (timeout: {timeout}s)...")
+    logger.info("Waiting for %s to exit (timeout: %ss)...", exe_name, timeout)
     
     if has_psutil:
-        while time.time() - start_time < timeout:
-            running = False
-            for proc in psutil.process_iter(['name', 'exe']):
-                try:
-                    proc_name = proc.info.get('name', '').lower()
-                    proc_exe = proc.info.get('exe', '') or ''
-                    
-                    if proc_name == exe_name or exe_name in proc_exe.lower():
-                        running = True
-                        break
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    pass
-            
-            if not running:
-                logger.info(f"{exe_name} has exited")
-                return True
-            
-            time.sleep(0.5)
+        if pid is not None:
+            # The launcher told us which process to wait for
+            try:
+                procs = [psutil.Process(pid)]
+            except psutil.NoSuchProcess:
+                procs = []
+        else:
+            # Find the app's processes once, by name only - fetching 'exe'
+            # costs a readlink / QueryFullProcessImageName per process on
+            # the system
+            procs = [
+                proc for proc in psutil.process_iter(['name'])
+                if (proc.info.get('name') or '').lower() == exe_name
+                and proc.pid != os.getpid()
+            ]
+        
+        # Wait on just those PIDs. On Windows psutil waits with
+        # WaitForSingleObject, so this returns as soon as the app exits
+        _, alive = psutil.wait_procs(procs, timeout=max(0, timeout - (time.time() - start_time)))
+        if not alive:
+            logger.info("%s has exited", exe_name)
+            return True
         
-        logger.warning(f"Timeout waiting for {exe_name} to exit")
+        logger.warning("Timeout waiting for %s to exit", exe_name)
+        return False
+    elif pid is not None:
+        if _wait_on_pid(pid, timeout):
+            logger.info("%s has exited", exe_name)
+            return True
+        
+        logger.warning("Timeout waiting for %s to exit", exe_name)
         return False
     else:
         # Fallback: just wait a fixed time
@@ -84,63 +138,186 @@ def wait_for_process_exit(exe_path: str, timeout: int = 30) -> bool:
         return True
 
 
-def copy_update_files(source: Path, target: Path) -> bool:
+def _wait_on_pid(pid: int, timeout: float) -> bool:
+    """
+    Wait for pid to exit without psutil. Returns False on timeout.
+    
+    Windows: WaitForSingleObject on the process handle - woken on exit.
+    Elsewhere: probe with signal 0, backing off from 10ms to 500ms so a
+    quick exit is seen at once without spinning through a long wait.
+    """
+    if sys.platform == "win32":
+        handle = _OpenProcess(SYNCHRONIZE, False, pid)
+        if not handle:
+            return True  # Already gone
+        try:
+            return _WaitForSingleObject(handle, int(timeout * 1000)) == WAIT_OBJECT_0
+        finally:
+            _CloseHandle(handle)
+    
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while True:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass  # Exists, owned by someone else
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, 0.5)
+
+
+# Files/dirs never copied from an update
+SKIP_ITEMS = frozenset({
+    'apply_updates.py',  # Don't copy ourselves
+    '__pycache__',
+    '.git',
+    '.venv',
+    'venv',
+    'update.log',
+    'config.yml',  # Preserve user config - TODO: merge configs instead?
+})
+
+# Dropped from copied directory trees (one ignore callable, built once)
+COPY_IGNORE = shutil.ignore_patterns('__pycache__', '*.pyc')
+
+# Top-level items are copied concurrently - per-file open/close overhead
+# dominates on Windows and overlaps well across threads
+COPY_WORKERS = min(8, os.cpu_count() or 4)
+
+
+def _fast_copy(src, dest):
+    """
+    Copy one file, keeping timestamps (copy2 semantics).
+    
+    Windows: CopyFileExW - a single in-kernel call instead of copy2's
+    read/write loop followed by a separate copystat.
+    Elsewhere: shutil.copy2.
+    """
+    if _CopyFileExW is not None:
+        if not _CopyFileExW(os.fspath(src), os.fspath(dest), None, None, None, 0):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return dest
+    return shutil.copy2(src, dest)
+
+
+def _remove_existing(dest: str):
+    """Remove dest if it exists - one stat instead of exists() + is_dir()."""
+    try:
+        st = os.stat(dest)
+    except FileNotFoundError:
+        return
+    
+    if S_ISDIR(st.st_mode):
+        shutil.rmtree(dest)
+    else:
+        os.unlink(dest)
+
+
+def _copy_one(entry: os.DirEntry, target: Path) -> tuple[bool, str]:
+    """
+    Copy one top-level item from the update into target, replacing any
+    existing item of the same name.
+    
+    Returns:
+        (success, item name)
+    """
+    dest = os.path.join(target, entry.name)
+    
+    try:
+        # Remove existing item first
+        _remove_existing(dest)
+        
+        # Copy new item
+        if entry.is_dir():
+            shutil.copytree(
+                entry.path, dest,
+                ignore=COPY_IGNORE,
+                copy_function=_fast_copy
+            )
+        else:
+            _fast_copy(entry.path, dest)
+        
+        return True, entry.name
+        
+    except Exception as e:
+        logger.error("  Failed to copy %s: %s", entry.name, e)
+        return False, entry.name
+
+
+def copy_update_files(source: Path, target: Path) -> Optional[bool]:
     """
     Copy files from extracted update to target directory.
     
+    Items are first copied into a staging directory inside target (same
+    volume), then renamed into place one by one. If any copy fails the
+    staging directory is dropped and target is left untouched.
+    
     Args:
         source: Directory containing extracted update files
         target: Target installation directory
         
     Returns:
-        True if successful
+        True if successful, None if the copy failed before anything in
+        target changed, False if swapping the staged items in failed
+        (target is partly updated and needs a rollback)
     """
-    logger.info(f"Copying files from {source} to {target}...")
-    
-    # Files/dirs to skip
-    skip_items = {
-        'apply_updates.py',  # Don't copy ourselves
-        '__pycache__',
-        '.git',
-        '.venv',
-        'venv',
-        'update.log',
-        'config.yml',  # Preserve user config - TODO: merge configs instead?
-    }
-    
-    copied_count = 0
+    logger.info("Copying files from %s to %s...", source, target)
+    
+    # DirEntry carries the entry type from the listing - no stat per item
+    entries = []
+    with os.scandir(source) as it:
+        for entry in it:
+            name = entry.name
+            if name in SKIP_ITEMS or name[:1] == '.':
+                logger.debug("Skipping: %s", name)
+                continue
+            entries.append(entry)
+    
+    staging = target / f"_staging_{os.getpid()}"
+    _remove_existing(str(staging))
+    staging.mkdir()
+    
+    copied = []
     error_count = 0
     
-    for item in source.iterdir():
-        if item.name in skip_items or item.name.startswith('.'):
-            logger.debug(f"Skipping: {item.name}")
-            continue
+    try:
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+            futures = [pool.submit(_copy_one, entry, staging) for entry in entries]
+            for future in as_completed(futures):
+                ok, name = future.result()
+                if ok:
+                    logger.debug("  Copied: %s", name)
+                    copied.append(name)
+                else:
+                    error_count += 1
         
-        dest = target / item.name
+        if error_count:
+            logger.error("%s items failed to copy, target left unchanged", error_count)
+            return None
         
-        try:
-            # Remove existing item first
-            if dest.exists():
-                if dest.is_dir():
-                    shutil.rmtree(dest)
-                else:
-                    dest.unlink()
-            
-            # Copy new item
-            if item.is_dir():
-                shutil.copytree(item, dest, ignore=shutil.ignore_patterns('__pycache__', '*.pyc'))
-            else:
-                shutil.copy2(item, dest)
-            
-            logger.info(f"  Copied: {item.name}")
-            copied_count += 1
-            
-        except Exception as e:
-            logger.error(f"  Failed to copy {item.name}: {e}")
-            error_count += 1
-    
-    logger.info(f"Copied {copied_count} items, {error_count} errors")
-    return error_count == 0
+        # Commit: swap each staged item in with a rename
+        for name in sorted(copied):
+            dest = os.path.join(target, name)
+            try:
+                _remove_existing(dest)
+                os.replace(os.path.join(staging, name), dest)
+            except Exception as e:
+                logger.error("  Failed to replace %s: %s", name, e)
+                error_count += 1
+        
+        # One summary record rather than one per item
+        if copied:
+            logger.info("  Copied: %s", ", ".join(sorted(copied)))
+        logger.info("Copied %s items, %s errors", len(copied) - error_count, error_count)
+        return error_count == 0
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
 
 
 def restart_application(exe_path: str, working_dir: str) -> bool:
@@ -154,7 +331,7 @@ def restart_application(exe_path: str, working_dir: str) -> bool:
     Returns:
         True if started successfully
     """
-    logger.info(f"Restarting application: {exe_path}")
+    logger.info("Restarting application: %s", exe_path)
     
     try:
         subprocess.Popen(
@@ -167,7 +344,7 @@ def restart_application(exe_path: str, working_dir: str) -> bool:
         logger.info("Application restarted successfully")
         return True
     except Exception as e:
-        logger.error(f"Failed to restart application: {e}")
+        logger.error("Failed to restart application: %s", e)
         return False
 
 
@@ -183,35 +360,50 @@ def rollback(rollback_dir: Path, target: Path) -> bool:
         True if successful
     """
     if not rollback_dir.exists():
-        logger.error(f"Rollback directory not found: {rollback_dir}")
+        logger.error("Rollback directory not found: %s", rollback_dir)
         return False
     
-    logger.info(f"Rolling back from {rollback_dir}...")
+    logger.info("Rolling back from %s...", rollback_dir)
     
     try:
-        for item in rollback_dir.iterdir():
-            if item.name in ('rollback_version.txt', '__pycache__'):
+        # Same volume: rename items back into place instead of copying
+        # every byte. That consumes the backup, so drop its version marker
+        # first - the manager only reuses a backup that still has one, and
+        # rebuilds it otherwise.
+        same_fs = os.stat(rollback_dir).st_dev == os.stat(target).st_dev
+        if same_fs:
+            try:
+                os.remove(rollback_dir / 'rollback_version.txt')
+            except FileNotFoundError:
+                pass
+        
+        with os.scandir(rollback_dir) as it:
+            entries = list(it)
+        
+        restored = []
+        for entry in entries:
+            if entry.name in ('rollback_version.txt', '__pycache__'):
                 continue
             
-            dest = target / item.name
-            
-            if dest.exists():
-                if dest.is_dir():
-                    shutil.rmtree(dest)
-                else:
-                    dest.unlink()
+            dest = os.path.join(target, entry.name)
+            _remove_existing(dest)
             
-            if item.is_dir():
-                shutil.copytree(item, dest)
+            if same_fs:
+                os.replace(entry.path, dest)
+            elif entry.is_dir():
+                shutil.copytree(entry.path, dest, copy_function=_fast_copy)
             else:
-                shutil.copy2(item, dest)
+                _fast_copy(entry.path, dest)
             
-            logger.info(f"  Restored: {item.name}")
+            logger.debug("  Restored: %s", entry.name)
+            restored.append(entry.name)
         
+        if restored:
+            logger.info("  Restored: %s", ", ".join(restored))
         logger.info("Rollback complete")
         return True
     except Exception as e:
-        logger.error(f"Rollback failed: {e}")
+        logger.error("Rollback failed: %s", e)
         return False
 
 
@@ -228,9 +420,9 @@ def cleanup(source_dir: Path, keep_zip: bool = True):
     try:
         if source_dir.exists():
             shutil.rmtree(source_dir)
-            logger.info(f"  Removed: {source_dir}")
+            logger.info("  Removed: %s", source_dir)
     except Exception as e:
-        logger.warning(f"  Failed to remove {source_dir}: {e}")
+        logger.warning("  Failed to remove %s: %s", source_dir, e)
 
 
 def main():
@@ -240,6 +432,7 @@ def main():
     parser.add_argument("--restart-exe", required=True, help="Executable to restart after update")
     parser.add_argument("--rollback-dir", required=True, help="Directory containing rollback backup")
     parser.add_argument("--no-restart", action="store_true", help="Don't restart after update")
+    parser.add_argument("--pid", type=int, default=None, help="PID of the agent process to wait for")
     args = parser.parse_args()
     
     target = Path(args.target).resolve()
@@ -250,14 +443,14 @@ def main():
     logger.info("=" * 60)
     logger.info("FabCore Agent Update")
     logger.info("=" * 60)
-    logger.info(f"Target:      {target}")
-    logger.info(f"Source:      {source}")
-    logger.info(f"Rollback:    {rollback_dir}")
-    logger.info(f"Restart exe: {restart_exe}")
+    logger.info("Target:      %s", target)
+    logger.info("Source:      %s", source)
+    logger.info("Rollback:    %s", rollback_dir)
+    logger.info("Restart exe: %s", restart_exe)
     logger.info("=" * 60)
     
     # Step 1: Wait for the main app to exit
-    if not wait_for_process_exit(restart_exe, timeout=30):
+    if not wait_for_process_exit(restart_exe, timeout=30, pid=args.pid):
         logger.warning("Application may still be running, proceeding anyway...")
     
     # Extra safety delay
@@ -266,13 +459,16 @@ def main():
     # Step 2: Copy update files
     success = copy_update_files(source, target)
     
-    if not success:
+    if success is None:
+        # Staging failed - target was never touched, so the backup stays unused
+        logger.error("Update failed, installation unchanged, restarting current version")
+    elif not success:
         logger.error("Update failed, attempting rollback...")
         if rollback(rollback_dir, target):
             logger.info("Rollback successful, restarting previous version")
         else:
             logger.error("Rollback also failed! Manual intervention required.")
-            logger.error(f"Backup may be available at: {rollback_dir}")
+            logger.error("Backup may be available at: %s", rollback_dir)
             sys.exit(1)
     
     # Step 3: Cleanup
@@ -1,11 +1,17 @@
 import asyncio
+import locale
 import logging
 import os
 import re
 import shutil
 import subprocess
 import sys
+import textwrap
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Callable
 
@@ -22,6 +28,25 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+# Download progress is logged at most once per this many bytes
+DOWNLOAD_LOG_STEP = 1024 * 1024
+
+# Threads copying top-level items into the rollback backup
+BACKUP_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+# Read buffer for the update zip during extraction
+ZIP_READ_BUFFER = 1024 * 1024
+
+# Threads extracting update zip entries, each with its own ZipFile handle
+EXTRACT_WORKERS = 4
+
+# Version strings: major.minor.patch followed by optional prerelease
+# Examples: 0.0.1, 0.0.1a, 0.0.1-alpha, 0.0.1-beta.2
+# Matched as two flat patterns - the core, then the rest of the string from
+# where the core ended - instead of one pattern with nested optional groups
+_CORE_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)')
+_PRE_RE = re.compile(r'(?:[-.]?([a-zA-Z]+)(?:\.(\d+))?)?$')
+
 
 class UpdateManager:
     """
@@ -40,6 +65,7 @@ class UpdateManager:
         on_force_update: Optional[Callable[[UpdateInfo], None]] = None
     ):
         self._current_version = current_version
+        self._current_version_parsed = self._parse_version(current_version)  # Fixed for the process lifetime
         self._server_base_url = server_base_url.rstrip("/")
         self._on_update_ready = on_update_ready
         self._on_force_update = on_force_update
@@ -63,6 +89,7 @@ class UpdateManager:
 
         self._pending_update: Optional[UpdateInfo] = None
         self._download_task: Optional[asyncio.Task] = None
+        self._session: Optional[aiohttp.ClientSession] = None
 
     @property
     def current_version(self) -> str:
@@ -125,14 +152,23 @@ class UpdateManager:
         logger.info(f"Update available: {self._current_version} → {update.version} (force={update.force})")
 
         if update.force:
-            # Force update - notify callback, then download and apply immediately
+            # Force update - notify callback, then download and apply immediately.
+            # A background download may be writing the same zip, so stop it first
+            await self._cancel_download()
             if self._on_force_update:
                 self._on_force_update(update)
             await self._download_and_apply(update)
             # Note: If successful, we won't reach here (sys.exit called)
             return {"type": "update_ack", "version": update.version, "status": "applying"}
         else:
-            # Optional update - download in background, notify when ready
+            # Optional update - download in background, notify when ready.
+            # Only one download at a time: keep one already fetching this
+            # version or newer, otherwise cancel it in favour of this one
+            if self._download_task and not self._download_task.done():
+                if self._pending_update and self._compare_versions(update.version, self._pending_update.version) <= 0:
+                    return {"type": "update_ack", "version": update.version, "status": "already_downloading"}
+                await self._cancel_download()
+
             self._pending_update = update
             self._download_task = asyncio.create_task(self._download_update(update))
             self._download_task.add_done_callback(self._on_download_complete)
@@ -160,39 +196,72 @@ class UpdateManager:
             UpdateInfo if update available, None otherwise
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self._server_base_url}/agent/version"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+            session = await self._get_session()
+            url = f"{self._server_base_url}/agent/version"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                data = await response.json()
+                
+                if self._needs_update(data.get("version", "")):
+                    # Ensure download_url is a full URL
+                    download_url = data.get("download_url", "")
+                    if download_url and not download_url.startswith("http"):
+                        download_url = f"{self._server_base_url}{download_url}"
+                    elif not download_url:
+                        download_url = f"{self._server_base_url}/agent/download/{data['version']}"
                     
-                    if self._needs_update(data.get("version", "")):
-                        # Ensure download_url is a full URL
-                        download_url = data.get("download_url", "")
-                        if download_url and not download_url.startswith("http"):
-                            download_url = f"{self._server_base_url}{download_url}"
-                        elif not download_url:
-                            download_url = f"{self._server_base_url}/agent/download/{data['version']}"
-                        
-                        return UpdateInfo(
-                            version=data["version"],
-                            force=data.get("force", False),
-                            changelog=data.get("changelog", ""),
-                            download_url=download_url,
-                            checksum=data.get("checksum"),
-                            min_version=data.get("min_version")
-                        )
-                    return None
+                    return UpdateInfo(
+                        version=data["version"],
+                        force=data.get("force", False),
+                        changelog=data.get("changelog", ""),
+                        download_url=download_url,
+                        checksum=data.get("checksum"),
+                        min_version=data.get("min_version")
+                    )
+                return None
         except Exception as e:
             logger.error(f"Failed to check for updates: {e}")
             return None
 
+    async def aclose(self):
+        """Close the shared HTTP session. Call on shutdown."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     # =========================================================================
     # Internal Methods
     # =========================================================================
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Shared HTTP session, created on first use, so the version check and
+        the download that follows reuse one pooled keep-alive connection.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def _cancel_download(self):
+        """Cancel the background download if one is running, and wait for it to stop."""
+        if not self._download_task or self._download_task.done():
+            return
+
+        logger.info(f"Cancelling download of {self._pending_update.version}")
+        self._download_task.cancel()
+        try:
+            await self._download_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        # Its zip was removed with the cancelled download - nothing is pending now
+        self._pending_update = None
+
     def _on_download_complete(self, task: asyncio.Task):
         """Callback when background download completes."""
+        if task.cancelled():
+            return  # Superseded by a newer update, which owns _pending_update now
         try:
             task.result()  # Raise any exception that occurred
             logger.info(f"Update {self._pending_update.version} downloaded and ready")
@@ -207,39 +276,52 @@ class UpdateManager:
         zip_path = self.updates_dir / f"FabCoreAgent_{update.version}.zip"
 
         if zip_path.exists():
-            logger.info(f"Update {update.version} already downloaded: {zip_path}")
-            return zip_path
+            if await asyncio.to_thread(update.verify, zip_path):
+                logger.info(f"Update {update.version} already downloaded: {zip_path}")
+                return zip_path
+            logger.warning(f"Cached update {update.version} failed checksum, downloading again")
+            zip_path.unlink()
 
         logger.info(f"Downloading update {update.version} from {update.download_url}...")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(update.download_url, timeout=aiohttp.ClientTimeout(total=300)) as response:
-                    response.raise_for_status()
-                    
-                    total_size = int(response.headers.get('content-length', 0))
-                    downloaded = 0
-
-                    with open(zip_path, "wb") as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            if total_size:
-                                progress = (downloaded / total_size) * 100
-                                logger.debug(f"Download progress: {progress:.1f}%")
+            session = await self._get_session()
+            async with session.get(update.download_url, timeout=aiohttp.ClientTimeout(total=300)) as response:
+                response.raise_for_status()
+                
+                total_size = int(response.headers.get('content-length', 0))
+                downloaded = 0
+                # Progress only goes to DEBUG - don't track it unless that's on
+                log_progress = bool(total_size) and logger.isEnabledFor(logging.DEBUG)
+                next_log = DOWNLOAD_LOG_STEP
+                # Hash as the bytes arrive - no second pass over the file
+                hasher = update.new_hasher()
+
+                # Write whatever the socket delivered straight to the fd -
+                # no fixed 8KB slicing, no second buffer in a file object
+                fd = os.open(zip_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+                try:
+                    async for chunk in response.content.iter_any():
+                        view = memoryview(chunk)
+                        while view:
+                            view = view[os.write(fd, view):]
+                        if hasher is not None:
+                            hasher.update(chunk)
+                        downloaded += len(chunk)
+                        if log_progress and downloaded >= next_log:
+                            next_log = downloaded + DOWNLOAD_LOG_STEP
+                            logger.debug("Download progress: %.1f%%", downloaded * 100.0 / total_size)
+                finally:
+                    os.close(fd)
+
+            if hasher is not None and not update.matches(hasher):
+                raise ValueError(f"Checksum mismatch for update {update.version}: expected {update.checksum}, got {hasher.hexdigest()}")
 
             logger.info(f"Update {update.version} downloaded: {zip_path}")
-            
-            # TODO: Verify checksum if provided
-            # if update.checksum:
-            #     actual_checksum = self._compute_checksum(zip_path)
-            #     if actual_checksum != update.checksum:
-            #         zip_path.unlink()
-            #         raise ValueError(f"Checksum mismatch: expected {update.checksum}, got {actual_checksum}")
 
             return zip_path
             
-        except Exception as e:
+        except (Exception, asyncio.CancelledError):
             # Clean up partial download
             if zip_path.exists():
                 zip_path.unlink()
@@ -265,8 +347,14 @@ class UpdateManager:
         4. Exits so the batch script can replace files
         
         Returns:
-            False if setup fails. Does not return on success (exits).
+            False if setup fails or version is already installed.
+            Does not return on success (exits).
         """
+        # Two notifications can race us here - nothing to do if we're already there
+        if self._compare_parsed(self._parse_version(version), self._current_version_parsed) == 0:
+            logger.info(f"Already at {version}, skipping apply")
+            return False
+
         zip_path = self.updates_dir / f"FabCoreAgent_{version}.zip"
         
         if not zip_path.exists():
@@ -274,16 +362,43 @@ class UpdateManager:
             return False
 
         # Create rollback backup first
-        await self._create_rollback_backup()
+        await self._create_rollback_backup(zip_path)
+
+        # Extract and write the updater scripts off the event loop
+        vbs_path = await asyncio.to_thread(self._prepare_update, version, zip_path)
 
+        logger.info(f"Launching updater script: {vbs_path}")
+        
+        # Launch the VBScript (wscript runs without console)
+        subprocess.Popen(
+            ['wscript.exe', str(vbs_path)],
+            cwd=str(self.updates_dir),
+            creationflags=subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        # Exit so the batch script can replace our files
+        logger.info("Exiting for update...")
+        sys.exit(0)
+
+    def _prepare_update(self, version: str, zip_path: Path) -> Path:
+        """
+        Extract the update and write the batch/VBScript pair that applies it
+        (runs in a worker thread). Returns the VBScript to launch.
+        """
         # Extract to temp location
         extract_dir = self.updates_dir / f"extracted_{version}"
         if extract_dir.exists():
-            shutil.rmtree(extract_dir)
+            # Rename the previous attempt aside and delete it in the background
+            # so extraction starts right away; the batch script sweeps up any
+            # stale copy we exit before finishing
+            stale = extract_dir.with_name(f"{extract_dir.name}.stale.{time.time_ns()}")
+            os.replace(extract_dir, stale)
+            threading.Thread(target=shutil.rmtree, args=(stale, True), daemon=True).start()
 
         logger.info(f"Extracting update to {extract_dir}...")
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            zf.extractall(extract_dir)
+        self._extract_zip(zip_path, extract_dir)
 
         logger.info("Creating update batch script...")
         
@@ -291,17 +406,20 @@ class UpdateManager:
         # 1. Wait for this process to exit
         # 2. Copy new files
         # 3. Restart the exe
-        batch_path = self.updates_dir / "apply_update.bat"
-
         extract_str = str(extract_dir)
         app_str = str(self.app_dir)
 
         log_path = str(self.updates_dir / "update_batch.log")
         exe_path = f"{app_str}\\FabCoreAgent.exe"
+        # Wait on our own PID rather than the image name - cheaper to filter,
+        # can't be fooled by another FabCoreAgent.exe, and works from source
+        my_pid = os.getpid()
 
         # Create the actual batch script
         batch_path = self.updates_dir / "apply_update.bat"
-        batch_content = f"""@echo off
+        # Dedented so the script carries no source indentation
+        batch_content = textwrap.dedent(f"""\
+        @echo off
         setlocal
 
         echo FabCore Agent Updater > "{log_path}"
@@ -309,7 +427,7 @@ class UpdateManager:
 
         echo Waiting for agent to exit... >> "{log_path}"
         :WAIT_LOOP
-        tasklist /FI "IMAGENAME eq FabCoreAgent.exe" 2>nul | find /I "FabCoreAgent.exe" >nul
+        tasklist /NH /FI "PID eq {my_pid}" 2>nul | find "{my_pid}" >nul
         if %ERRORLEVEL%==0 (
             timeout /t 1 /nobreak >nul 2>&1
             goto WAIT_LOOP
@@ -320,7 +438,7 @@ class UpdateManager:
         timeout /t 3 /nobreak >nul 2>&1
 
         echo Copying new files... >> "{log_path}"
-        robocopy "{extract_str}" "{app_str}" /E /NFL /NDL /NJH /NJS /NC /NS /NP /W:3 /R:5 >> "{log_path}" 2>&1
+        robocopy "{extract_str}" "{app_str}" /E /MT:8 /NFL /NDL /NJH /NJS /NC /NS /NP /W:3 /R:5 >> "{log_path}" 2>&1
 
         echo Verifying exe exists... >> "{log_path}"
         if not exist "{exe_path}" (
@@ -330,6 +448,7 @@ class UpdateManager:
 
         echo Cleaning up extracted files... >> "{log_path}"
         rmdir /S /Q "{extract_str}" >nul 2>&1
+        for /D %%D in ("{extract_str}.stale.*") do rmdir /S /Q "%%D" >nul 2>&1
 
         echo Launching updated agent... >> "{log_path}"
         timeout /t 2 /nobreak >nul 2>&1
@@ -337,10 +456,11 @@ class UpdateManager:
 
         echo Update complete! >> "{log_path}"
         endlocal
-        """
-        
-        with open(batch_path, 'w') as f:
-            f.write(batch_content)
+        """)
+
+        # One write each, encoded as text mode would (ANSI code page, CRLF)
+        encoding = locale.getpreferredencoding(False)
+        batch_path.write_bytes(batch_content.replace('\n', '\r\n').encode(encoding))
         
         # Create VBScript launcher to run batch completely hidden
         vbs_path = self.updates_dir / "apply_update.vbs"
@@ -351,26 +471,83 @@ fso.DeleteFile "{vbs_path}", True
 fso.DeleteFile "{batch_path}", True
 '''
         
-        with open(vbs_path, 'w') as f:
-            f.write(vbs_content)
-        
-        logger.info(f"Launching updater script: {vbs_path}")
-        
-        # Launch the VBScript (wscript runs without console)
-        subprocess.Popen(
-            ['wscript.exe', str(vbs_path)],
-            cwd=str(self.updates_dir),
-            creationflags=subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
+        vbs_path.write_bytes(vbs_content.replace('\n', '\r\n').encode(encoding))
 
-        # Exit so the batch script can replace our files
-        logger.info("Exiting for update...")
-        sys.exit(0)
+        return vbs_path
 
-    async def _create_rollback_backup(self):
+    @staticmethod
+    def _extract_zip(zip_path: Path, extract_dir: Path):
+        """
+        Extract zip_path into extract_dir, entries spread over EXTRACT_WORKERS
+        threads. Onedir bundles are hundreds of small files, so per-file
+        open/write/close dominates, and zlib releases the GIL while inflating.
+        """
+        with zipfile.ZipFile(zip_path) as zf:
+            entries = zf.infolist()
+
+            # Create every directory up front - two workers extracting into
+            # the same new directory would race on creating it
+            dirs = {info.filename.rpartition('/')[0] + '/' for info in entries if '/' in info.filename}
+            for name in sorted(dirs):
+                zf.extract(zipfile.ZipInfo(name), extract_dir)
+
+        files = [info for info in entries if not info.is_dir()]
+        chunks = [files[i::EXTRACT_WORKERS] for i in range(EXTRACT_WORKERS)]
+        with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as pool:
+            futures = [pool.submit(UpdateManager._extract_entries, zip_path, chunk, extract_dir) for chunk in chunks if chunk]
+            for future in as_completed(futures):
+                future.result()
+
+    @staticmethod
+    def _extract_entries(zip_path: Path, entries: list[zipfile.ZipInfo], extract_dir: Path):
+        """Extract entries through a private ZipFile - the handle isn't thread-safe."""
+        # 1MB read buffer instead of the default 8KB - far fewer read calls
+        # while inflating the members
+        with open(zip_path, 'rb', buffering=ZIP_READ_BUFFER) as raw, zipfile.ZipFile(raw) as zf:
+            for info in entries:
+                zf.extract(info, extract_dir)
+
+    async def _create_rollback_backup(self, zip_path: Path):
         """Create a backup of the current version for potential rollback."""
+        # Opt-out for CI/dev runs where there is nothing worth rolling back to
+        if os.environ.get("FABCORE_SKIP_ROLLBACK"):
+            logger.warning("FABCORE_SKIP_ROLLBACK is set, not creating a rollback backup")
+            return
+
+        await asyncio.to_thread(self._write_rollback_backup, zip_path)
+
+    def _write_rollback_backup(self, zip_path: Path):
+        """Blocking half of _create_rollback_backup - runs in a worker thread."""
+        # Files the update will overwrite must be real copies (see _snapshot_file)
+        with zipfile.ZipFile(zip_path) as zf:
+            names = [name for name in zf.namelist() if not name.endswith('/')]
+        replaced = frozenset(os.path.normcase(os.path.normpath(self.app_dir / name)) for name in names)
+
+        items = [
+            item for item in self.app_dir.iterdir()
+            # Skip hidden files, cache, and the updates directory itself
+            if not (item.name.startswith('.') or item.name in ('__pycache__', '.venv', 'venv', '.git'))
+        ]
+
+        # The version file is only written after every item was backed up,
+        # and rollback removes it when it consumes the backup. If it names
+        # the running version and every file still has a matching backup
+        # copy, reuse the backup - after unlinking anything this particular
+        # update will overwrite
+        version_file = self.rollback_dir / "rollback_version.txt"
+        try:
+            if (version_file.read_text().strip() == self._current_version
+                    and self._backup_matches(items)):
+                logger.info(f"Rollback backup for {self._current_version} already exists, reusing it")
+                for name in names:
+                    backup = self.rollback_dir / name
+                    if backup.is_file() and backup.stat().st_nlink > 1:
+                        backup.unlink()
+                        shutil.copy2(self.app_dir / name, backup)
+                return
+        except OSError:
+            pass
+
         if self.rollback_dir.exists():
             shutil.rmtree(self.rollback_dir)
 
@@ -378,36 +555,108 @@ fso.DeleteFile "{batch_path}", True
 
         logger.info(f"Creating rollback backup at {self.rollback_dir}...")
 
-        for item in self.app_dir.iterdir():
-            # Skip hidden files, cache, and the updates directory itself
-            if item.name.startswith('.') or item.name in ('__pycache__', '.venv', 'venv', '.git'):
-                continue
-
-            dest = self.rollback_dir / item.name
-            try:
-                if item.is_dir():
-                    shutil.copytree(item, dest, ignore=shutil.ignore_patterns('__pycache__', '*.pyc'))
-                else:
-                    shutil.copy2(item, dest)
-            except Exception as e:
-                logger.warning(f"Failed to backup {item.name}: {e}")
+        # Snapshot top-level items concurrently
+        failed = self._copy_items(items, self.rollback_dir, replaced)
+        if failed:
+            # No version file - an incomplete backup must never be reused
+            logger.warning(f"Rollback backup incomplete ({failed} items failed), it will be rebuilt next time")
+            return
 
         # Save version info for rollback identification
-        version_file = self.rollback_dir / "rollback_version.txt"
         with open(version_file, "w") as f:
             f.write(self._current_version)
 
         logger.info(f"Rollback backup created: {self._current_version}")
 
+    @staticmethod
+    def _copy_items(items: list[Path], dest_dir: Path, replaced: frozenset[str]) -> int:
+        """Snapshot items into dest_dir on a thread pool. Returns how many failed."""
+        with ThreadPoolExecutor(max_workers=BACKUP_WORKERS) as pool:
+            futures = [pool.submit(UpdateManager._copy_item, item, dest_dir / item.name, replaced) for item in items]
+            return sum(not future.result() for future in as_completed(futures))
+
+    @staticmethod
+    def _copy_item(src: Path, dest: Path, replaced: frozenset[str]) -> bool:
+        """Snapshot one file or directory tree, logging instead of raising on failure."""
+        try:
+            if src.is_dir():
+                UpdateManager._snapshot_tree(src, dest, replaced)
+            else:
+                UpdateManager._snapshot_file(str(src), str(dest), replaced)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to backup {src.name}: {e}")
+            return False
+
+    def _backup_matches(self, items: list[Path]) -> bool:
+        """
+        True if every file under items (bytecode aside, as in _snapshot_tree)
+        has a backup copy of the same size and mtime. A stat walk, so nested
+        files rewritten in place - robocopy keeps the new source's timestamps -
+        or a consumed/partial backup are caught without reading any data.
+        """
+        for item in items:
+            if not item.is_dir():
+                if not self._same_stat(str(item), str(self.rollback_dir / item.name)):
+                    return False
+                continue
+
+            for dirpath, dirnames, filenames in os.walk(item, followlinks=True):
+                dirnames[:] = [d for d in dirnames if d != '__pycache__']
+                backup_dir = os.path.join(self.rollback_dir, os.path.relpath(dirpath, self.app_dir))
+                for name in filenames:
+                    if not name.endswith('.pyc') and not self._same_stat(
+                            os.path.join(dirpath, name), os.path.join(backup_dir, name)):
+                        return False
+        return True
+
+    @staticmethod
+    def _same_stat(src: str, backup: str) -> bool:
+        """Same size and mtime - within 2s, since FAT volumes store even seconds."""
+        try:
+            a, b = os.stat(src), os.stat(backup)
+        except OSError:
+            return False
+        return a.st_size == b.st_size and abs(a.st_mtime - b.st_mtime) <= 2
+
+    @staticmethod
+    def _snapshot_tree(src: Path, dst: Path, replaced: frozenset[str]):
+        """Recreate src's directories under dst and snapshot every file (skips bytecode)."""
+        for dirpath, dirnames, filenames in os.walk(src, followlinks=True):
+            dirnames[:] = [d for d in dirnames if d != '__pycache__']
+            target = os.path.join(dst, os.path.relpath(dirpath, src))
+            os.makedirs(target, exist_ok=True)
+            for name in filenames:
+                if not name.endswith('.pyc'):
+                    UpdateManager._snapshot_file(os.path.join(dirpath, name), os.path.join(target, name), replaced)
+
+    @staticmethod
+    def _snapshot_file(src: str, dst: str, replaced: frozenset[str]):
+        """
+        Hard-link src to dst - a new directory entry, no data copied.
+
+        Files in replaced are copied instead: robocopy rewrites existing files
+        in place, which would change a linked backup along with the original.
+        Also copies when linking fails (another volume, or no hard links).
+        """
+        if os.path.normcase(src) not in replaced:
+            try:
+                os.link(src, dst)
+                return
+            except OSError:
+                pass
+        shutil.copy2(src, dst)
+
     # =========================================================================
     # Version Comparison Helpers
     # =========================================================================
 
     def _needs_update(self, new_version: str) -> bool:
         """Check if new_version is newer than current version."""
-        return self._version_greater_than(new_version, self._current_version)
+        return self._compare_parsed(self._parse_version(new_version), self._current_version_parsed) > 0
 
     @staticmethod
+    @lru_cache(maxsize=128)  # Pure function of the string; the same few versions recur
     def _parse_version(v: str) -> tuple:
         """
         Parse version string into comparable tuple.
@@ -423,20 +672,23 @@ fso.DeleteFile "{batch_path}", True
         """
         if not v:
             return (0, 0, 0, '', 0)
+
+        # Fast path for plain stable releases - no regex needed
+        parts = v.split('.')
+        if len(parts) == 3 and all(part.isdecimal() for part in parts):
+            return (int(parts[0]), int(parts[1]), int(parts[2]), '', 0)
         
-        # Match: major.minor.patch followed by optional prerelease
-        # Examples: 0.0.1, 0.0.1a, 0.0.1-alpha, 0.0.1-beta.2
-        pattern = r'^(\d+)\.(\d+)\.(\d+)(?:[-.]?([a-zA-Z]+)(?:\.(\d+))?)?$'
-        match = re.match(pattern, v)
+        core = _CORE_RE.match(v)
+        pre = core and _PRE_RE.match(v, core.end())
         
-        if not match:
+        if not pre:
             return (0, 0, 0, '', 0)
         
-        major = int(match.group(1))
-        minor = int(match.group(2))
-        patch = int(match.group(3))
-        prerelease_type = (match.group(4) or '').lower()  # 'a', 'b', 'alpha', 'beta', ''
-        prerelease_num = int(match.group(5)) if match.group(5) else 0
+        major = int(core.group(1))
+        minor = int(core.group(2))
+        patch = int(core.group(3))
+        prerelease_type = (pre.group(1) or '').lower()  # 'a', 'b', 'alpha', 'beta', ''
+        prerelease_num = int(pre.group(2)) if pre.group(2) else 0
         
         return (major, minor, patch, prerelease_type, prerelease_num)
 
@@ -450,9 +702,11 @@ fso.DeleteFile "{batch_path}", True
              0 if a == b
              1 if a > b
         """
-        pa = UpdateManager._parse_version(a)
-        pb = UpdateManager._parse_version(b)
-        
+        return UpdateManager._compare_parsed(UpdateManager._parse_version(a), UpdateManager._parse_version(b))
+
+    @staticmethod
+    def _compare_parsed(pa: tuple, pb: tuple) -> int:
+        """Compare two _parse_version tuples. Same return values as _compare_versions."""
         # Compare major.minor.patch first
         for i in range(3):
             if pa[i] > pb[i]: